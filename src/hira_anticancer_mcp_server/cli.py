@@ -43,13 +43,18 @@ logger = logging.getLogger("hira-cli")
 
 async def cmd_check() -> None:
     """업데이트 확인."""
-    from .scraper import check_for_updates, ensure_playwright
+    from .scraper import check_for_updates, close_browser_context, close_http_client, \
+        ensure_playwright
 
-    await ensure_playwright()
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    await ensure_playwright(DATA_DIR)
 
     logger.info("업데이트 확인 중…")
-    results = await check_for_updates(DATA_DIR)
+    try:
+        results = await check_for_updates(DATA_DIR)
+    finally:
+        await close_browser_context()
+        await close_http_client()
 
     # 결과 출력
     for key, info in results["files"].items():
@@ -64,28 +69,43 @@ async def cmd_check() -> None:
 
 async def cmd_download(file_key: str | None = None) -> None:
     """파일 다운로드."""
-    from .scraper import FILE_IDENTIFIERS, MetadataStore, download_file, \
-        ensure_playwright, cleanup_old_files
+    from .scraper import FILE_IDENTIFIERS, MetadataStore, download_files, \
+        ensure_playwright, cleanup_old_files, close_browser_context, close_http_client
 
-    await ensure_playwright()
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    store = MetadataStore(DATA_DIR)
+    await ensure_playwright(DATA_DIR)
+    store = MetadataStore.for_dir(DATA_DIR)
 
     keys = [file_key] if file_key else list(FILE_IDENTIFIERS.keys())
-    for key in keys:
-        logger.info(f"다운로드: {key}")
-        record = await download_file(key, DATA_DIR)
-        store.update(key, record)
-        print(f"✅ {key}: {record['filename']} ({record['size']:,} bytes)")
+    try:
+        logger.info(f"다운로드: {', '.join(keys)}")
+        outcomes = await download_files(keys, DATA_DIR)
+    finally:
+        await close_browser_context()
+        await close_http_client()
+
+    records = {k: r for k, r in outcomes.items() if not isinstance(r, Exception)}
+    store.update_many(records)
+    for key, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            print(f"❌ {key}: {outcome}")
+        else:
+            print(f"✅ {key}: {outcome['filename']} ({outcome['size']:,} bytes)")
+
+    if records:
+        cleanup_old_files(DATA_DIR, keep_latest_only=True, store=store)
 
-    cleanup_old_files(DATA_DIR, keep_latest_only=True)
+    # 실패한 파일이 있으면 기존처럼 예외로 종료
+    for outcome in outcomes.values():
+        if isinstance(outcome, Exception):
+            raise outcome
 
 
 async def cmd_status() -> None:
     """현재 상태 조회."""
     from .scraper import MetadataStore
 
-    store = MetadataStore(DATA_DIR)
+    store = MetadataStore.for_dir(DATA_DIR)
     status = store.get_all_status()
 
     print(f"📊 데이터 디렉토리: {DATA_DIR}")
@@ -117,11 +137,11 @@ async def cmd_cleanup() -> None:
 
 async def cmd_daemon() -> None:
     """데몬 모드 — 내장 스케줄러로 매일 자동 실행."""
-    from .scraper import ensure_playwright
+    from .scraper import close_browser_context, close_http_client, ensure_playwright
     from .scheduler import HiraScheduler
 
-    await ensure_playwright()
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    await ensure_playwright(DATA_DIR)
 
     scheduler = HiraScheduler(DATA_DIR)
     scheduler.enable()
@@ -137,6 +157,10 @@ async def cmd_daemon() -> None:
     except KeyboardInterrupt:
         print("\n데몬 종료…")
         await scheduler.stop()
+    finally:
+        # 데몬 수명 동안 유지한 브라우저 컨텍스트·HTTP 연결 정리
+        await close_browser_context()
+        await close_http_client()
 
 
 def main():
@@ -5,22 +5,96 @@ Excel(허가초과_항암요법)과 PDF(항암화학요법_공고전문)를 파
 MCP TextContent / ImageContent 형태로 반환합니다.
 
 전략:
-  - Excel: openpyxl text extraction (머지셀 forward-fill, data_only=True)
-  - PDF:   하이브리드 (텍스트 전용 → pdfplumber, 테이블 포함 → PyMuPDF ImageContent)
+  - Excel: openpyxl read_only 스트리밍 (머지셀 forward-fill, data_only=True)
+  - PDF:   하이브리드 (텍스트 → PyMuPDF, 테이블 감지 → pdfplumber, 테이블 포함 → PyMuPDF ImageContent)
 """
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import functools
 import io
+import json
 import logging
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress, groupby, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterator
 
 from mcp.types import ImageContent, TextContent
 
+try:
+    import pybase64 as base64  # SIMD 가속 base64 (대용량 이미지 인코딩)
+except ImportError:  # pragma: no cover - 선택 의존성 미설치 환경
+    import base64
+
+try:
+    import orjson  # 빠른 JSON 직렬화 (페이지 텍스트 캐시)
+except ImportError:  # pragma: no cover - 선택 의존성 미설치 환경
+    orjson = None
+
 logger = logging.getLogger("hira-mcp-reader")
 
+# 파싱 전용 단일 워커 스레드 — 공유 문서·캐시(_fitz_docs, _sheet_rows_cache 등)는
+# 이 스레드에서만 다루므로 락이 필요 없고, 무거운 파싱이 이벤트 루프를 막지 않음
+_parse_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hira-parse")
+
+
+async def _run_parse(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """func를 파싱 워커 스레드에서 실행하고 결과를 기다립니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_parse_executor, functools.partial(func, *args, **kwargs))
+
+# 무거운 파서 모듈은 실제로 필요할 때 한 번만 import (서버 기동 시간 단축)
+_openpyxl = None
+_fitz = None
+_pdfplumber = None
+
+
+def _get_openpyxl():
+    global _openpyxl
+    if _openpyxl is None:
+        import openpyxl
+        _openpyxl = openpyxl
+    return _openpyxl
+
+
+def _get_fitz():
+    global _fitz
+    if _fitz is None:
+        import fitz  # PyMuPDF
+        _fitz = fitz
+    return _fitz
+
+
+def _get_pdfplumber():
+    global _pdfplumber
+    if _pdfplumber is None:
+        import pdfplumber
+        _pdfplumber = pdfplumber
+    return _pdfplumber
+
+
+_pil_image = None
+_pil_checked = False
+
+
+def _get_pil_image():
+    """WEBP 인코딩 가능한 PIL.Image 모듈 (Pillow 미설치·WEBP 미지원이면 None)"""
+    global _pil_image, _pil_checked
+    if not _pil_checked:
+        _pil_checked = True
+        try:
+            from PIL import Image, features
+            if features.check("webp"):
+                _pil_image = Image
+        except ImportError:
+            pass
+    return _pil_image
+
 # ─────────────────────────────────────────────────────────────────────
 # Excel 리더 (openpyxl)
 # ─────────────────────────────────────────────────────────────────────
@@ -31,9 +105,30 @@ _PREFERRED_SHEET_KEYWORDS = ["인정", "용법용량"]
 # 헤더 행 판별용 키워드 (이 중 2개 이상 포함 시 헤더로 간주)
 _HEADER_KEYWORDS = ["요법코드", "암종", "항암화학요법", "투여대상", "투여단계",
                     "연번", "구분", "적응증", "약제", "성분명"]
+_HEADER_KEYWORD_RE = re.compile("|".join(map(re.escape, _HEADER_KEYWORDS)))
+
+# 암종 컬럼 감지 키워드
+_CANCER_COLUMN_KEYWORDS = ["암종", "cancer", "질환", "적응증", "진단", "암 종"]
+_CANCER_COLUMN_RE = re.compile("|".join(map(re.escape, _CANCER_COLUMN_KEYWORDS)))
+
+# Markdown 셀 최대 글자 수 (초과 시 "…"로 축약)
+_MAX_CELL_CHARS = 300
 
+# 시트 XML의 머지셀 항목 (read_only 모드는 merged_cells를 제공하지 않음)
+# <mergeCells>는 스키마상 <sheetData> 뒤에 오므로 그 이전 구간은 파싱하지 않음
+_MERGE_CELLS_MARKER = b"mergeCells"
+_MERGE_CELL_REF = re.compile(rb'<(?:\w+:)?mergeCell\b[^>]*?\sref="([A-Z]+\d+(?::[A-Z]+\d+)?)"')
+_XML_CHUNK_SIZE = 1 << 20
 
-def read_excel(
+# 시트 행 캐시 — {(path, sheet 인자): (stamp, sheet_title, sheet_names, rows)}
+# HIRA 파일은 월 단위로 갱신되므로 같은 파일 재조회 시 openpyxl 파싱을 건너뜀
+_sheet_rows_cache: OrderedDict[
+    tuple[str, str | None], tuple[tuple[int, int], str | None, list[str], list[list[str]]]
+] = OrderedDict()
+_SHEET_ROWS_CACHE_MAX = 8
+
+
+async def read_excel(
     filepath: Path,
     *,
     sheet: str | None = None,
@@ -41,7 +136,7 @@ def read_excel(
     max_rows: int = 200,
 ) -> list[TextContent]:
     """
-    Excel 파일을 읽어 Markdown 테이블로 변환합니다.
+    Excel 파일을 읽어 Markdown 테이블로 변환합니다 (파싱은 워커 스레드에서 실행).
 
     Args:
         filepath: .xlsx 파일 경로
@@ -52,73 +147,51 @@ def read_excel(
     Returns:
         list[TextContent] — Markdown 테이블 + 요약 정보
     """
-    import openpyxl
-
-    wb = openpyxl.load_workbook(str(filepath), data_only=True, read_only=False)
+    return await _run_parse(
+        _read_excel, filepath, sheet=sheet, cancer_type=cancer_type, max_rows=max_rows,
+    )
 
-    if sheet:
-        if sheet not in wb.sheetnames:
-            return [TextContent(
-                type="text",
-                text=f"⚠️ 시트 '{sheet}'를 찾을 수 없습니다.\n"
-                     f"사용 가능한 시트: {', '.join(wb.sheetnames)}"
-            )]
-        ws = wb[sheet]
-    else:
-        ws = _select_preferred_sheet(wb)
-
-    # ── 머지셀 forward-fill 맵 구축 ─────────────────────────────
-    merge_map: dict[tuple[int, int], Any] = {}
-    for merged_range in ws.merged_cells.ranges:
-        top_left_value = ws.cell(
-            row=merged_range.min_row,
-            column=merged_range.min_col,
-        ).value
-        for row in range(merged_range.min_row, merged_range.max_row + 1):
-            for col in range(merged_range.min_col, merged_range.max_col + 1):
-                merge_map[(row, col)] = top_left_value
-
-    # ── 데이터 추출 ─────────────────────────────────────────────
-    all_rows: list[list[str]] = []
-    for row_idx, row in enumerate(ws.iter_rows(values_only=False), start=1):
-        cells: list[str] = []
-        for cell in row:
-            coord = (cell.row, cell.column)
-            if coord in merge_map:
-                val = merge_map[coord]
-            else:
-                val = cell.value
-            cells.append(str(val).strip() if val is not None else "")
-        all_rows.append(cells)
 
-    sheet_title = ws.title
-    sheet_names = wb.sheetnames
-    wb.close()
+def _read_excel(
+    filepath: Path,
+    *,
+    sheet: str | None,
+    cancer_type: str | None,
+    max_rows: int,
+) -> list[TextContent]:
+    """read_excel 본체 (파싱 워커 스레드에서 실행)."""
+    sheet_title, sheet_names, all_rows = _load_sheet_rows(filepath, sheet)
+    if sheet_title is None:
+        return [TextContent(
+            type="text",
+            text=f"⚠️ 시트 '{sheet}'를 찾을 수 없습니다.\n"
+                 f"사용 가능한 시트: {', '.join(sheet_names)}"
+        )]
 
+    # ── 헤더 감지 (키워드 기반, 찾는 즉시 중단) ────────────────
     if not all_rows:
         return [TextContent(type="text", text="⚠️ 시트에 데이터가 없습니다.")]
 
-    # ── 헤더 감지 (키워드 기반) ──────────────────────────────────
     header_idx = _find_header_row(all_rows)
-
     headers = all_rows[header_idx]
-    data_rows = all_rows[header_idx + 1:]
 
-    # 빈 행 제거 (모든 셀이 비어있는 행)
-    data_rows = [row for row in data_rows if any(c for c in row)]
+    # ── 빈 행 제거 + 암종 필터 (행은 이미 메모리에 있으므로 전체 개수까지 셈) ──
+    cancer_col_idx = _find_cancer_column(headers) if cancer_type else None
 
-    # ── 암종 필터 적용 ──────────────────────────────────────────
-    if cancer_type:
-        cancer_col_idx = _find_cancer_column(headers)
-        if cancer_col_idx is not None:
-            data_rows = [
-                row for row in data_rows
-                if cancer_type in row[cancer_col_idx]
-            ]
+    data_rows: list[list[str]] = []
+    total_rows = 0
+    for row in islice(all_rows, header_idx + 1, None):
+        if not any(c for c in row):
+            continue
+        if cancer_col_idx is not None and (
+            cancer_col_idx >= len(row) or cancer_type not in row[cancer_col_idx]
+        ):
+            continue
+        total_rows += 1
+        if len(data_rows) < max_rows:
+            data_rows.append(row)
 
-    total_count = len(data_rows)
-    truncated = total_count > max_rows
-    data_rows = data_rows[:max_rows]
+    truncated = total_rows > max_rows
 
     # ── Markdown 테이블 생성 ────────────────────────────────────
     md_lines = _to_markdown_table(headers, data_rows)
@@ -126,12 +199,12 @@ def read_excel(
     # ── 요약 정보 ──────────────────────────────────────────────
     summary_parts = [
         f"📊 시트: {sheet_title}",
-        f"📏 전체 행: {total_count}행",
+        f"📏 전체 행: {total_rows}행",
     ]
     if cancer_type:
         summary_parts.append(f"🔍 필터: '{cancer_type}'")
     if truncated:
-        summary_parts.append(f"⚠️ {max_rows}행까지만 표시 (전체 {total_count}행)")
+        summary_parts.append(f"⚠️ {max_rows}행까지만 표시 (전체 {total_rows}행)")
 
     summary = " | ".join(summary_parts)
     sheets_info = f"사용 가능한 시트: {', '.join(sheet_names)}"
@@ -154,6 +227,129 @@ def read_excel(
     return [TextContent(type="text", text=f"{summary}\n{sheets_info}{warning}\n\n{md_lines}")]
 
 
+def _load_sheet_rows(
+    filepath: Path, sheet: str | None
+) -> tuple[str | None, list[str], list[list[str]]]:
+    """
+    시트의 머지셀 forward-fill된 전체 행을 읽습니다 (파일 스탬프 기준 캐시).
+
+    Returns:
+        (sheet_title, sheet_names, rows) — 지정한 시트가 없으면 sheet_title은 None.
+        rows는 캐시와 공유되므로 호출자가 수정하면 안 됩니다.
+    """
+    key = (str(filepath), sheet)
+    stamp = _file_stamp(filepath)
+    cached = _sheet_rows_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        _sheet_rows_cache.move_to_end(key)
+        return cached[1], cached[2], cached[3]
+
+    openpyxl = _get_openpyxl()
+    wb = openpyxl.load_workbook(str(filepath), data_only=True, read_only=True)
+    try:
+        sheet_names = list(wb.sheetnames)
+        if sheet and sheet not in sheet_names:
+            return None, sheet_names, []
+        ws = wb[sheet] if sheet else _select_preferred_sheet(wb)
+        sheet_title = ws.title
+        try:
+            merges = _read_merge_ranges(ws)
+        except (AttributeError, KeyError) as e:
+            # openpyxl 내부 속성(_archive, _worksheet_path)이 바뀐 경우
+            logger.warning(f"머지셀 직접 읽기 실패 — 일반 모드로 다시 읽음: {e!r}")
+            merges = None
+        if merges is not None:
+            rows = list(_iter_filled_rows(ws, merges))
+    finally:
+        wb.close()
+
+    if merges is None:
+        # 일반 모드는 느리지만 공개 API(merged_cells)로 머지 범위를 제공
+        wb = openpyxl.load_workbook(str(filepath), data_only=True)
+        try:
+            ws = wb[sheet_title]
+            merges = sorted(
+                (r.min_row, r.max_row, r.min_col, r.max_col) for r in ws.merged_cells.ranges
+            )
+            rows = list(_iter_filled_rows(ws, merges))
+        finally:
+            wb.close()
+
+    _sheet_rows_cache[key] = (stamp, sheet_title, sheet_names, rows)
+    if len(_sheet_rows_cache) > _SHEET_ROWS_CACHE_MAX:
+        _sheet_rows_cache.popitem(last=False)
+    return sheet_title, sheet_names, rows
+
+
+def _read_merge_ranges(ws) -> list[tuple[int, int, int, int]]:
+    """
+    read_only 워크시트의 머지 범위를 시트 XML에서 직접 읽습니다.
+
+    시트 XML을 청크 단위로 훑어 <mergeCells> 위치를 찾고, 그 뒤 구간에서만
+    ref 속성을 정규식으로 추출합니다 (셀 데이터는 XML 파싱하지 않음).
+
+    Returns:
+        [(min_row, max_row, min_col, max_col), ...] — min_row 순 정렬
+    """
+    from openpyxl.utils.cell import range_boundaries
+
+    region: list[bytes] | None = None
+    tail = b""
+    with ws.parent._archive.open(ws._worksheet_path) as src:
+        while chunk := src.read(_XML_CHUNK_SIZE):
+            if region is not None:
+                region.append(chunk)
+                continue
+            buf = tail + chunk
+            idx = buf.find(_MERGE_CELLS_MARKER)
+            if idx >= 0:
+                region = [buf[max(0, idx - 16):]]
+            else:
+                tail = buf[-len(_MERGE_CELLS_MARKER):]
+
+    if region is None:
+        return []
+
+    ranges: list[tuple[int, int, int, int]] = []
+    for match in _MERGE_CELL_REF.finditer(b"".join(region)):
+        min_col, min_row, max_col, max_row = range_boundaries(match.group(1).decode("ascii"))
+        ranges.append((min_row, max_row, min_col, max_col))
+
+    ranges.sort()
+    return ranges
+
+
+def _iter_filled_rows(
+    ws, merges: list[tuple[int, int, int, int]]
+) -> Iterator[list[str]]:
+    """
+    시트 행을 문자열 리스트로 스트리밍합니다. 머지 범위는 top-left 값으로 채웁니다.
+
+    머지 범위는 dict로 펼치지 않고, 현재 행에 걸친 범위만 active 목록으로 유지합니다.
+    """
+    next_merge = 0
+    active: list[tuple[int, int, int, Any]] = []  # (max_row, min_col, max_col, value)
+
+    for row_idx, values in enumerate(ws.iter_rows(values_only=True), start=1):
+        row = list(values)
+
+        # 이번 행에서 시작하는 머지 활성화 — top-left 값은 시작 행에서 읽음
+        while next_merge < len(merges) and merges[next_merge][0] <= row_idx:
+            min_row, max_row, min_col, max_col = merges[next_merge]
+            next_merge += 1
+            value = row[min_col - 1] if min_col <= len(row) else None
+            active.append((max_row, min_col, max_col, value))
+
+        if active:
+            active = [m for m in active if m[0] >= row_idx]
+            for _max_row, min_col, max_col, value in active:
+                if len(row) < max_col:
+                    row.extend([None] * (max_col - len(row)))
+                row[min_col - 1:max_col] = [value] * (max_col - min_col + 1)
+
+        yield [str(v).strip() if v is not None else "" for v in row]
+
+
 def _select_preferred_sheet(wb):
     """선호 시트를 자동 선택합니다. 키워드 매칭 → 활성 시트 순."""
     for name in wb.sheetnames:
@@ -165,25 +361,28 @@ def _select_preferred_sheet(wb):
 
 def _find_header_row(all_rows: list[list[str]]) -> int:
     """헤더 키워드가 포함된 행을 찾습니다. 없으면 첫 비어있지 않은 행."""
+    first_nonempty = None  # fallback 후보 — 같은 루프에서 기록
     for i, row in enumerate(all_rows):
+        if first_nonempty is None and any(row):
+            first_nonempty = i
         row_text = " ".join(row).lower()
-        matches = sum(1 for kw in _HEADER_KEYWORDS if kw in row_text)
-        if matches >= 2:
-            return i
+        if not _HEADER_KEYWORD_RE.search(row_text):
+            continue
+        # 키워드 2개를 찾는 즉시 종료
+        hits = 0
+        for kw in _HEADER_KEYWORDS:
+            if kw in row_text:
+                hits += 1
+                if hits >= 2:
+                    return i
 
-    # fallback: 첫 번째 비어있지 않은 행
-    for i, row in enumerate(all_rows):
-        if any(c for c in row):
-            return i
-    return 0
+    return first_nonempty or 0
 
 
 def _find_cancer_column(headers: list[str]) -> int | None:
     """헤더에서 암종 관련 컬럼 인덱스를 찾습니다."""
-    cancer_keywords = ["암종", "cancer", "질환", "적응증", "진단", "암 종"]
     for idx, h in enumerate(headers):
-        h_lower = h.lower()
-        if any(kw in h_lower for kw in cancer_keywords):
+        if _CANCER_COLUMN_RE.search(h.lower()):
             return idx
     # fallback: "투여대상" 컬럼 (암종명이 투여대상에 포함되는 경우도 있음)
     for idx, h in enumerate(headers):
@@ -199,22 +398,20 @@ def _to_markdown_table(headers: list[str], rows: list[list[str]]) -> str:
 
     # 열 수 통일
     n_cols = len(headers)
+    limit = _MAX_CELL_CHARS
 
-    # 긴 셀 내용 축약 (300자 초과 시)
-    def _trunc(s: str, limit: int = 300) -> str:
-        return s[:limit] + "…" if len(s) > limit else s
-
-    header_line = "| " + " | ".join(_trunc(h) for h in headers) + " |"
-    sep_line = "| " + " | ".join("---" for _ in headers) + " |"
-
-    data_lines = []
+    # 긴 셀 내용 축약 (300자 초과 시) — 셀마다 함수 호출하지 않도록 인라인 처리
+    lines = [
+        "| " + " | ".join([h[:limit] + "…" if len(h) > limit else h for h in headers]) + " |",
+        "| " + " | ".join(["---"] * n_cols) + " |",
+    ]
+    append = lines.append
     for row in rows:
         # 열 수가 헤더보다 적으면 빈 문자열로 채움
-        padded = row[:n_cols] + [""] * max(0, n_cols - len(row))
-        line = "| " + " | ".join(_trunc(c) for c in padded) + " |"
-        data_lines.append(line)
+        padded = row[:n_cols] if len(row) >= n_cols else row + [""] * (n_cols - len(row))
+        append("| " + " | ".join([c[:limit] + "…" if len(c) > limit else c for c in padded]) + " |")
 
-    return "\n".join([header_line, sep_line] + data_lines)
+    return "\n".join(lines)
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -223,9 +420,14 @@ def _to_markdown_table(headers: list[str], rows: list[list[str]]) -> str:
 
 # 페이지 타입 감지 상수
 _TABLE_THRESHOLD = 1  # pdfplumber가 N개 이상 테이블 감지 시 → 이미지 렌더링
+_TABLE_MIN_AREA_RATIO = 0.2  # 페이지 면적 대비 이 비율 미만인 테이블은 무시 (텍스트로 충분)
+_TABLE_MIN_ROWS = 4  # 이 행 수 미만의 작은 테이블은 무시
 _MAX_PAGES_PER_CALL = 50  # 한 번에 처리할 최대 페이지 (토큰 제한 방지)
 _IMAGE_DPI = 150  # ImageContent 해상도
 _MAX_IMAGE_PAGES = 5  # 이미지 렌더링 최대 페이지 (1MB 제한 방지)
+_PAGE_TEXT_CACHE_FILENAME = ".page_text_cache.json"  # PDF와 같은 디렉토리에 저장
+_PAGE_TEXT_CACHE_MAX = 500  # 캐시 최대 페이지 수 (LRU)
+_PAGE_TEXT_CACHE_VERSION = 2  # 텍스트 추출 방식이 바뀌면 올림 (이전 캐시 무시)
 
 # 암종 영한 매핑 (검색용)
 _CANCER_ALIASES: dict[str, list[str]] = {
@@ -271,6 +473,23 @@ _CANCER_ALIASES: dict[str, list[str]] = {
     "골수형성이상증후군": ["mds", "myelodysplastic"],
 }
 
+
+def _build_alias_index() -> dict[str, list[str]]:
+    """영문 별칭 → 한글 암종명 목록 (같은 별칭이 여러 암종에 걸칠 수 있음, 사전 순서 유지)"""
+    index: dict[str, list[str]] = {}
+    for korean_name, aliases in _CANCER_ALIASES.items():
+        for alias in aliases:
+            index.setdefault(alias, []).append(korean_name)
+    return index
+
+
+_ALIAS_TO_CANCERS = _build_alias_index()
+
+# 긴 별칭을 먼저 시도 ("non-small cell lung"이 "small cell lung"보다 우선)
+_CANCER_ALIAS_RE = re.compile(
+    "|".join(map(re.escape, sorted(_ALIAS_TO_CANCERS, key=len, reverse=True)))
+)
+
 # PDF 섹션별 키워드 매핑 (항암화학요법 공고전문 구조)
 PDF_SECTIONS: dict[str, list[str]] = {
     "일반원칙": ["일반원칙"],
@@ -281,8 +500,19 @@ PDF_SECTIONS: dict[str, list[str]] = {
     "부록": ["부록", "부표"],
 }
 
+# 섹션별 키워드 / 다른 섹션 시작 키워드 정규식 (스캔 폴백에서 페이지마다 한 번씩 검색)
+_SECTION_KEYWORD_RES: dict[str, re.Pattern[str]] = {
+    name: re.compile("|".join(map(re.escape, kws))) for name, kws in PDF_SECTIONS.items()
+}
+_OTHER_SECTION_RES: dict[str, re.Pattern[str]] = {
+    name: re.compile("|".join(
+        re.escape(kw) for other, kws in PDF_SECTIONS.items() if other != name for kw in kws
+    ))
+    for name in PDF_SECTIONS
+}
 
-def read_pdf(
+
+async def read_pdf(
     filepath: Path,
     *,
     pages: str | None = None,
@@ -290,6 +520,7 @@ def read_pdf(
     cancer_type: str | None = None,
     search: str | None = None,
     text_only: bool = False,
+    on_progress: Callable[[int, int], Awaitable[None]] | None = None,
 ) -> list[TextContent | ImageContent]:
     """
     PDF를 하이브리드 방식으로 읽습니다.
@@ -301,29 +532,68 @@ def read_pdf(
         cancer_type: 암종명 (예: "난소암", "ovarian"). TOC에서 페이지 범위 자동 탐색.
         search: 키워드 검색 (예: 약제명, 암종명). 매칭 페이지와 주변 텍스트 반환.
         text_only: True이면 이미지 없이 텍스트만 반환 (1MB 제한 회피).
+        on_progress: 테이블 페이지 렌더링이 하나 끝날 때마다 (완료 수, 전체 수)로 호출.
 
     Returns:
         list[TextContent | ImageContent] 혼합 리스트
     """
-    import fitz  # PyMuPDF
-    import pdfplumber
+    render_jobs: list[tuple[int, int]] = []
+
+    def _parse() -> list[TextContent | ImageContent]:
+        _load_page_text_cache(filepath.parent)
+        return _read_pdf(
+            filepath, pages=pages, section=section, cancer_type=cancer_type,
+            search=search, text_only=text_only, render_jobs=render_jobs,
+        )
+
+    # 텍스트 추출·테이블 감지는 파싱 워커에서, 테이블 렌더링은 스레드 풀에서 병렬로
+    try:
+        results = await _run_parse(_parse)
+        if render_jobs:
+            results = await _render_table_pages(filepath, results, render_jobs, on_progress)
+        return results
+    finally:
+        await _run_parse(_save_page_text_cache, filepath.parent)
+
+
+def _read_pdf(
+    filepath: Path,
+    *,
+    pages: str | None,
+    section: str | None,
+    cancer_type: str | None,
+    search: str | None,
+    text_only: bool,
+    render_jobs: list[tuple[int, int]],
+) -> list[TextContent | ImageContent]:
+    """
+    read_pdf 본체 (파싱 워커 스레드에서 실행, 페이지 텍스트 캐시 로드/저장은 read_pdf에서 처리).
 
-    doc = fitz.open(str(filepath))
+    테이블 페이지는 여기서 렌더링하지 않고, 안내 텍스트의 결과 인덱스와
+    페이지 인덱스를 render_jobs에 기록합니다 (_render_table_pages에서 병렬 처리).
+    """
+    doc = _open_fitz(filepath)  # 파일별 공유 문서 (닫지 않음)
     total_pages = len(doc)
 
     # ── 키워드 검색 모드 ────────────────────────────────────────
     if search:
-        doc.close()
         return _search_pdf(filepath, search, total_pages)
 
     # ── 페이지 범위 결정 ────────────────────────────────────────
     range_label = None  # 사용자에게 보여줄 범위 설명
 
     if cancer_type:
-        toc, toc_page_idx = _parse_toc(filepath)
-        page_indices, matched_name = _find_cancer_pages(toc, cancer_type, total_pages, filepath, toc_page_idx)
+        # 같은 파일(SHA-256)에서 이미 찾은 암종이면 목차·본문 탐색 생략
+        store, content_hash = _stored_content_hash(filepath)
+        cached = store.get_cancer_cache(content_hash, cancer_type) if content_hash else None
+        if cached is not None:
+            page_indices, matched_name = cached["pages"], cached["name"]
+        else:
+            toc, toc_page_idx = _parse_toc(filepath)
+            page_indices, matched_name = _find_cancer_pages(toc, cancer_type, total_pages, filepath, toc_page_idx)
+            if page_indices and content_hash:
+                store.set_cancer_cache(content_hash, cancer_type, page_indices, matched_name)
         if not page_indices:
-            doc.close()
             available = ", ".join(e["name"] for e in toc) if toc else "(TOC 파싱 실패)"
             return [TextContent(
                 type="text",
@@ -332,10 +602,14 @@ def read_pdf(
             )]
         range_label = f"🔍 암종: '{matched_name}'"
     elif section:
-        toc, toc_page_idx = _parse_toc(filepath)
-        page_indices = _find_section_pages_from_toc(toc, section, filepath, total_pages, toc_page_idx)
+        store, content_hash = _stored_content_hash(filepath)
+        page_indices = store.get_section_cache(content_hash, section) if content_hash else None
+        if page_indices is None:
+            toc, toc_page_idx = _parse_toc(filepath)
+            page_indices = _find_section_pages_from_toc(toc, section, filepath, total_pages, toc_page_idx)
+            if page_indices and content_hash:
+                store.set_section_cache(content_hash, section, page_indices)
         if not page_indices:
-            doc.close()
             return [TextContent(
                 type="text",
                 text=f"⚠️ 섹션 '{section}'을 찾을 수 없습니다.\n"
@@ -349,7 +623,6 @@ def read_pdf(
         # 기본: TOC 페이지를 보여줌 (사용자가 탐색할 수 있도록)
         toc, _toc_idx = _parse_toc(filepath)
         if toc:
-            doc.close()
             return _format_toc_response(filepath, toc, total_pages)
         page_indices = list(range(min(total_pages, _MAX_PAGES_PER_CALL)))
 
@@ -378,31 +651,40 @@ def read_pdf(
         meta += "\n📝 텍스트 전용 모드"
     results.append(TextContent(type="text", text=meta))
 
-    # pdfplumber로 테이블 감지
-    pdf_plumber = pdfplumber.open(str(filepath))
+    # pdfplumber는 테이블 감지에만 사용 (텍스트는 PyMuPDF로 추출) — 필요할 때 열기
+    pdf_plumber = None
 
     text_buffer: list[str] = []  # 연속 텍스트 페이지 버퍼
 
     for page_idx in page_indices:
         page_num = page_idx + 1  # 1-indexed
 
-        try:
-            plumber_page = pdf_plumber.pages[page_idx]
-        except IndexError:
+        if not 0 <= page_idx < total_pages:
             continue
+        fitz_page = doc[page_idx]
 
         # text_only 모드이면 항상 텍스트 추출
         if text_only:
-            text = _extract_text_safe(plumber_page, page_num)
+            text = _extract_text_fitz(fitz_page, page_num)
             text_buffer.append(text)
             continue
 
-        # pdfplumber로 테이블 감지
-        try:
-            tables = plumber_page.find_tables()
-            has_tables = len(tables) >= _TABLE_THRESHOLD
-        except Exception:
-            has_tables = False
+        # pdfplumber로 테이블 감지 (선/도형이 없는 페이지는 건너뜀)
+        has_tables = False
+        if _may_have_tables(fitz_page):
+            try:
+                if pdf_plumber is None:
+                    pdf_plumber = _open_plumber(filepath)
+                plumber_page = pdf_plumber.pages[page_idx]
+                page_area = plumber_page.width * plumber_page.height
+                tables = [
+                    t for t in plumber_page.find_tables()
+                    if _is_significant_table(t, page_area)
+                ]
+                plumber_page.flush_cache()
+                has_tables = len(tables) >= _TABLE_THRESHOLD
+            except Exception:
+                has_tables = False
 
         if has_tables and image_page_count < _MAX_IMAGE_PAGES:
             # 텍스트 버퍼가 있으면 먼저 flush
@@ -412,39 +694,23 @@ def read_pdf(
                 ))
                 text_buffer.clear()
 
-            # 테이블 페이지 → 이미지 렌더링 (PyMuPDF)
-            try:
-                fitz_page = doc[page_idx]
-                mat = fitz.Matrix(_IMAGE_DPI / 72, _IMAGE_DPI / 72)
-                pix = fitz_page.get_pixmap(matrix=mat)
-                png_bytes = pix.tobytes("png")
-
-                b64_data = base64.b64encode(png_bytes).decode("ascii")
-
-                results.append(TextContent(
-                    type="text",
-                    text=f"--- 📊 p.{page_num} (테이블 포함 → 이미지) ---"
-                ))
-                results.append(ImageContent(
-                    type="image",
-                    data=b64_data,
-                    mimeType="image/png",
-                ))
-                image_page_count += 1
-            except Exception as e:
-                logger.warning(f"페이지 {page_num} 이미지 렌더링 실패: {e}")
-                text = _extract_text_safe(plumber_page, page_num)
-                text_buffer.append(text)
+            # 테이블 페이지 → 이미지 렌더링 예약 (PyMuPDF, read_pdf에서 병렬 실행)
+            results.append(TextContent(
+                type="text",
+                text=f"--- 📊 p.{page_num} (테이블 포함 → 이미지) ---"
+            ))
+            render_jobs.append((len(results) - 1, page_idx))
+            image_page_count += 1
         else:
             # 텍스트 전용 페이지 또는 이미지 제한 초과
             if has_tables and image_page_count >= _MAX_IMAGE_PAGES:
-                text = _extract_text_safe(plumber_page, page_num)
+                text = _extract_text_fitz(fitz_page, page_num)
                 text_buffer.append(
                     f"--- p.{page_num} (테이블 포함, 이미지 제한 초과 → 텍스트) ---\n"
                     + text.split("\n", 1)[-1] if "\n" in text else text
                 )
             else:
-                text = _extract_text_safe(plumber_page, page_num)
+                text = _extract_text_fitz(fitz_page, page_num)
                 text_buffer.append(text)
 
     # 남은 텍스트 버퍼 flush
@@ -461,16 +727,160 @@ def read_pdf(
                  f"text_only=true로 전체 텍스트 조회 가능."
         ))
 
-    pdf_plumber.close()
-    doc.close()
-
     return results
 
 
-def _extract_text_safe(plumber_page, page_num: int) -> str:
-    """pdfplumber 페이지에서 안전하게 텍스트를 추출합니다."""
+def _stored_content_hash(filepath: Path):
+    """
+    metadata.json에 기록된 파일의 SHA-256을 찾습니다.
+
+    Returns:
+        (MetadataStore, sha256) — 기록이 없거나 크기가 다르면 sha256은 None
+    """
+    from .scraper import FILE_IDENTIFIERS, MetadataStore
+
+    store = MetadataStore.for_dir(filepath.parent)
+    size = filepath.stat().st_size
+    for file_key in FILE_IDENTIFIERS:
+        cur = store.get_current(file_key)
+        if not cur or cur.get("size") != size:
+            continue
+        if filepath.name in (cur.get("filename"), Path(cur.get("latest_path", "")).name):
+            return store, cur.get("sha256")
+    return store, None
+
+
+def _may_have_tables(fitz_page) -> bool:
+    """
+    pdfplumber find_tables()가 테이블을 찾을 수 있는 페이지인지 빠르게 판별합니다.
+
+    기본 전략("lines")은 선·사각형·곡선 경계만으로 테이블을 구성하므로,
+    PyMuPDF에서 벡터 도형이 하나도 없는 페이지는 pdfplumber 파싱을 생략합니다.
+    """
     try:
-        text = plumber_page.extract_text() or ""
+        return bool(fitz_page.get_cdrawings())
+    except Exception:
+        return True
+
+
+def _is_significant_table(table, page_area: float) -> bool:
+    """
+    이미지로 렌더링할 만한 테이블인지 판별합니다.
+
+    머리글 몇 줄짜리 작은 표만 있는 페이지는 텍스트로 충분하므로,
+    페이지 면적의 _TABLE_MIN_AREA_RATIO 이상이고 _TABLE_MIN_ROWS행 이상인 표만 인정합니다.
+    """
+    x0, top, x1, bottom = table.bbox
+    if (x1 - x0) * (bottom - top) < _TABLE_MIN_AREA_RATIO * page_area:
+        return False
+    return len(table.rows) >= _TABLE_MIN_ROWS
+
+
+def _render_page_image(filepath: Path, page_idx: int, dpi: int) -> tuple[str, str]:
+    """
+    페이지 하나를 렌더링하여 (base64 문자열, MIME 타입)으로 반환합니다 (워커 스레드에서 실행).
+
+    테이블 페이지는 선·글자 위주라 무손실 WEBP가 PNG보다 훨씬 작으므로 WEBP를
+    우선 사용하고, Pillow에서 WEBP를 쓸 수 없으면 PNG로 인코딩합니다.
+    PyMuPDF Document는 스레드 간 공유가 안전하지 않으므로 호출마다 메모리에 있는
+    PDF 바이트로 따로 엽니다 (디스크 재읽기 없음).
+    """
+    fitz = _get_fitz()
+
+    doc = fitz.open(stream=_pdf_bytes(filepath), filetype="pdf")
+    try:
+        mat = fitz.Matrix(dpi / 72, dpi / 72)
+        pix = doc[page_idx].get_pixmap(matrix=mat)
+    finally:
+        doc.close()
+
+    image_mod = _get_pil_image()
+    if image_mod is None:
+        return base64.b64encode(pix.tobytes("png")).decode("ascii"), "image/png"
+
+    img = image_mod.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    buf = io.BytesIO()
+    img.save(buf, format="WEBP", lossless=True, method=4)
+    return base64.b64encode(buf.getbuffer()).decode("ascii"), "image/webp"
+
+
+async def _render_table_pages(
+    filepath: Path,
+    results: list[TextContent | ImageContent],
+    render_jobs: list[tuple[int, int]],
+    on_progress: Callable[[int, int], Awaitable[None]] | None = None,
+) -> list[TextContent | ImageContent]:
+    """
+    예약된 테이블 페이지를 스레드 풀에서 병렬 렌더링하여 결과에 끼워 넣습니다.
+
+    렌더링에 실패한 페이지는 안내 텍스트 대신 추출 텍스트로 대체합니다.
+    """
+    sem = asyncio.Semaphore(min(_MAX_IMAGE_PAGES, os.cpu_count() or 4))
+    done = 0
+
+    async def _render(page_idx: int) -> tuple[str, str]:
+        nonlocal done
+        try:
+            async with sem:
+                return await asyncio.to_thread(_render_page_image, filepath, page_idx, _IMAGE_DPI)
+        finally:
+            done += 1
+            if on_progress is not None:
+                await on_progress(done, len(render_jobs))
+
+    rendered = await asyncio.gather(
+        *(_render(page_idx) for _slot, page_idx in render_jobs),
+        return_exceptions=True,
+    )
+
+    by_slot = {
+        slot: (page_idx, image)
+        for (slot, page_idx), image in zip(render_jobs, rendered)
+    }
+    merged: list[TextContent | ImageContent] = []
+
+    for slot, item in enumerate(results):
+        if slot not in by_slot:
+            merged.append(item)
+            continue
+
+        page_idx, image = by_slot[slot]
+        if isinstance(image, BaseException):
+            if not isinstance(image, Exception):
+                raise image
+            logger.warning(f"페이지 {page_idx + 1} 이미지 렌더링 실패: {image}")
+            merged.append(TextContent(
+                type="text",
+                text=await _run_parse(_extract_page_text, filepath, page_idx),
+            ))
+            continue
+
+        b64_data, mime_type = image
+        merged.append(item)
+        merged.append(ImageContent(
+            type="image",
+            data=b64_data,
+            mimeType=mime_type,
+        ))
+
+    return merged
+
+
+def _fitz_plain_text(fitz_page) -> str:
+    """PyMuPDF 페이지 텍스트 (읽기 순서 정렬, 블록 사이 빈 줄 제거)"""
+    raw = fitz_page.get_text("text", sort=True)
+    return "\n".join(ln.rstrip() for ln in raw.splitlines() if ln.strip())
+
+
+def _extract_page_text(filepath: Path, page_idx: int) -> str:
+    """공유 문서에서 페이지 텍스트를 추출합니다 (파싱 워커 스레드에서 실행)."""
+    return _extract_text_fitz(_open_fitz(filepath)[page_idx], page_idx + 1)
+
+
+def _extract_text_fitz(fitz_page, page_num: int) -> str:
+    """PyMuPDF 페이지에서 안전하게 텍스트를 추출합니다 (읽기 순서 정렬)."""
+    try:
+        text = _fitz_plain_text(fitz_page)
         if text.strip():
             return f"--- p.{page_num} ---\n{text.strip()}"
         else:
@@ -480,16 +890,169 @@ def _extract_text_safe(plumber_page, page_num: int) -> str:
 
 
 # ─────────────────────────────────────────────────────────────────────
-# PDF TOC 파싱 (목차에서 암종→페이지 매핑 추출)
+# PDF 문서·페이지 텍스트 캐시
+#   - 파일 스탬프 (mtime_ns, size)가 바뀌면 자동 무효화
+#   - 페이지 텍스트: (filepath, mtime_ns, page_idx) → text
 # ─────────────────────────────────────────────────────────────────────
-import re
+_page_text_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_page_text_cache_loaded: set[str] = set()
+_page_text_cache_dirty: set[str] = set()  # 디스크에 저장되지 않은 항목이 있는 디렉토리
+
+# 파일별 PDF 원본 바이트 — {path: (stamp, bytes)} (공유 문서와 렌더링 스레드가 함께 사용)
+_pdf_data: dict[str, tuple[tuple[int, int], bytes]] = {}
+# 파일별 PyMuPDF / pdfplumber 문서 — {path: (stamp, doc)}
+_fitz_docs: dict[str, tuple[tuple[int, int], Any]] = {}
+_plumber_docs: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def _file_stamp(filepath: Path) -> tuple[int, int]:
+    """파일 변경 감지용 (mtime_ns, size)"""
+    st = filepath.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _open_shared(filepath: Path, docs: dict, opener: Callable[[bytes], Any]):
+    """
+    파일별 문서를 열어 재사용합니다 (호출자는 close하지 않음).
+
+    파일 핸들을 잡고 있으면 Windows에서 _latest 파일 교체가 막히므로
+    파일 내용을 메모리로 읽어서 엽니다.
+    """
+    key = str(filepath)
+    stamp = _file_stamp(filepath)
+    cached = docs.get(key)
+    if cached is not None:
+        if cached[0] == stamp:
+            return cached[1]
+        cached[1].close()
+
+    doc = opener(_pdf_bytes(filepath))
+    docs[key] = (stamp, doc)
+    return doc
+
+
+def _pdf_bytes(filepath: Path) -> bytes:
+    """PDF 파일 내용을 메모리에서 꺼내거나 읽습니다 (파일 스탬프 기준, 렌더링 스레드에서도 호출)."""
+    key = str(filepath)
+    stamp = _file_stamp(filepath)
+    cached = _pdf_data.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    data = filepath.read_bytes()
+    _pdf_data[key] = (stamp, data)
+    return data
+
+
+def _open_fitz(filepath: Path):
+    """텍스트 추출용 PyMuPDF 문서 (파일별 공유)"""
+    return _open_shared(
+        filepath, _fitz_docs,
+        lambda data: _get_fitz().open(stream=data, filetype="pdf"),
+    )
+
+
+def _open_plumber(filepath: Path):
+    """테이블 감지용 pdfplumber 문서 (파일별 공유)"""
+    return _open_shared(
+        filepath, _plumber_docs,
+        lambda data: _get_pdfplumber().open(io.BytesIO(data)),
+    )
+
+
+def _pdf_page_count(filepath: Path) -> int:
+    """PDF 페이지 수"""
+    return len(_open_fitz(filepath))
+
+
+def _page_text(filepath: Path, page_idx: int) -> str:
+    """
+    페이지 텍스트(PyMuPDF)를 캐시에서 꺼내거나 추출합니다.
+
+    파일이 갱신되면 mtime_ns가 바뀌므로 이전 항목은 자연히 무효화됩니다.
+    추출 실패(예외)는 캐시하지 않습니다.
+    """
+    key = (str(filepath), filepath.stat().st_mtime_ns, page_idx)
+    text = _page_text_cache.get(key)
+    if text is not None:
+        _page_text_cache.move_to_end(key)
+        return text
+
+    text = _fitz_plain_text(_open_fitz(filepath)[page_idx])
+    _page_text_cache[key] = text
+    if len(_page_text_cache) > _PAGE_TEXT_CACHE_MAX:
+        _page_text_cache.popitem(last=False)
+    _page_text_cache_dirty.add(str(filepath.parent))
+    return text
+
+
+def _load_page_text_cache(cache_dir: Path) -> None:
+    """디스크 캐시를 메모리로 불러옵니다 (디렉토리당 프로세스에서 1회)."""
+    if str(cache_dir) in _page_text_cache_loaded:
+        return
+    _page_text_cache_loaded.add(str(cache_dir))
+
+    cache_path = cache_dir / _PAGE_TEXT_CACHE_FILENAME
+    if not cache_path.exists():
+        return
+    try:
+        raw = cache_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if not isinstance(data, dict) or data.get("version") != _PAGE_TEXT_CACHE_VERSION:
+            return  # 추출 방식이 다른 이전 캐시 — 다음 저장 시 덮어씀
+        for path, mtime_ns, page_idx, text in data["entries"]:
+            _page_text_cache.setdefault((path, mtime_ns, page_idx), text)
+        while len(_page_text_cache) > _PAGE_TEXT_CACHE_MAX:
+            _page_text_cache.popitem(last=False)
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        logger.warning(f"페이지 텍스트 캐시 로드 실패 (무시): {e}")
+
+
+def _save_page_text_cache(cache_dir: Path) -> None:
+    """
+    해당 디렉토리에 새 항목이 있을 때만 캐시를 디스크에 저장합니다.
+
+    임시 파일에 쓴 뒤 os.replace로 교체합니다 (중단 시에도 기존 파일 보존).
+    """
+    if str(cache_dir) not in _page_text_cache_dirty:
+        return
+
+    data = {
+        "version": _PAGE_TEXT_CACHE_VERSION,
+        "entries": [
+            [path, mtime_ns, page_idx, text]
+            for (path, mtime_ns, page_idx), text in _page_text_cache.items()
+            if Path(path).parent == cache_dir
+        ],
+    }
+    cache_path = cache_dir / _PAGE_TEXT_CACHE_FILENAME
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(data))
+        else:
+            tmp_path.write_bytes(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+        _page_text_cache_dirty.discard(str(cache_dir))
+    except OSError as e:
+        logger.warning(f"페이지 텍스트 캐시 저장 실패 (무시): {e}")
+
 
+# ─────────────────────────────────────────────────────────────────────
+# PDF TOC 파싱 (목차에서 암종→페이지 매핑 추출)
+# ─────────────────────────────────────────────────────────────────────
 # 항목 시작 패턴: "숫자. " 또는 "숫자-숫자. "
 _TOC_ENTRY_START = re.compile(r"(\d+(?:-\d+)?)\.\s")
 
 # 섹션 레벨 패턴: "□ 섹션명···숫자"
 _TOC_SECTION_PATTERN = re.compile(r"□\s*(.+?)·+\s*(\d+)")
 
+# 항목 segment 내 이름/페이지 분리: "이름·····숫자" 또는 "이름 숫자"
+_TOC_DOT_PAGE = re.compile(r"(.+?)·+(\d+)")
+_TOC_TRAILING_PAGE = re.compile(r"\s(\d+)\s*$")
+
+# 페이지 하단 인쇄 번호 (마지막 줄이 숫자만 있는 경우)
+_FOOTER_PAGE_NUM = re.compile(r"\d+")
+
 
 def _parse_toc_entries_from_line(line: str) -> list[dict]:
     """한 줄에서 TOC 항목들을 추출합니다 (두 컬럼 대응)."""
@@ -506,46 +1069,99 @@ def _parse_toc_entries_from_line(line: str) -> list[dict]:
         # segment에서 이름과 페이지 번호 분리
         # 패턴: "이름·····숫자" 또는 "이름 숫자" (마지막 숫자가 페이지)
         # 먼저 dot 구분 시도 (첫 번째 ·+숫자 매칭 — 비탐욕적)
-        dot_match = re.match(r"(.+?)·+(\d+)", segment)
+        dot_match = _TOC_DOT_PAGE.match(segment)
         if dot_match:
             name = dot_match.group(1).strip()
             page = int(dot_match.group(2))
         else:
             # dot 없는 경우: 마지막 숫자를 페이지로 추출
-            num_match = re.search(r"\s(\d+)\s*$", segment)
+            num_match = _TOC_TRAILING_PAGE.search(segment)
             if num_match:
                 name = segment[:num_match.start()].strip()
                 page = int(num_match.group(1))
             else:
                 continue  # 파싱 실패 → 건너뜀
 
-        name = re.sub(r"\s+", " ", name)
+        name = " ".join(name.split())
         if name and page > 0:
             entries.append({"num": num, "name": name, "page": page})
 
     return entries
 
 
+# 파일별 TOC 파싱 결과 — {path: (stamp, (entries, toc_page_idx))}
+_toc_cache: dict[str, tuple[tuple[int, int], tuple[list[dict], int]]] = {}
+
+
+def _parse_outline_toc(filepath: Path) -> tuple[list[dict], list[dict]]:
+    """
+    PDF에 내장된 outline(북마크)에서 TOC 항목을 읽습니다.
+
+    "숫자. 이름" 형태의 북마크만 암종 항목으로 사용하고, 나머지는 섹션 항목으로
+    취급합니다. outline 페이지는 실제 PDF 페이지(1-indexed)이므로 각 항목에
+    "outline": True를 표시해 오프셋 보정을 건너뛰게 합니다.
+
+    Returns:
+        (toc_entries, section_entries) — outline이 없거나 암종 항목이 없으면 ([], [])
+    """
+    outline = _open_fitz(filepath).get_toc(simple=True)
+
+    toc_entries: list[dict] = []
+    section_entries: list[dict] = []
+    for _level, title, page in outline:
+        if page <= 0:
+            continue
+        title = " ".join(title.split())
+        match = _TOC_ENTRY_START.match(title)
+        if match:
+            name = title[match.end():].strip()
+            if name:
+                toc_entries.append(
+                    {"num": match.group(1), "name": name, "page": page, "outline": True}
+                )
+        else:
+            section_entries.append({"name": title.lstrip("□ "), "page": page})
+
+    if not toc_entries:
+        return [], []
+    return toc_entries, section_entries
+
+
 def _parse_toc(filepath: Path) -> tuple[list[dict], int]:
     """
-    PDF 목차 페이지를 파싱하여 암종별 페이지 매핑을 추출합니다.
+    PDF 목차를 파싱하여 암종별 페이지 매핑을 추출합니다.
+
+    내장 outline이 있으면 그것을 사용하고, 없으면 목차 페이지 텍스트를 파싱합니다.
 
     Returns:
         (entries, toc_page_idx) where entries is
         [{"num": "1", "name": "소세포폐암", "page": 16}, ...]
-        페이지 번호 순으로 정렬됨. toc_page_idx는 목차 페이지의 실제 PDF 인덱스.
+        페이지 번호 순으로 정렬됨. toc_page_idx는 목차 페이지의 실제 PDF 인덱스
+        (outline 사용 시 -1).
     """
-    import pdfplumber
-
-    pdf = pdfplumber.open(str(filepath))
+    key = str(filepath)
+    stamp = _file_stamp(filepath)
+    cached = _toc_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        entries, toc_page_idx = cached[1]
+        return [dict(e) for e in entries], toc_page_idx
+
+    toc_entries, section_entries = _parse_outline_toc(filepath)
+    if toc_entries:
+        toc_entries = _finalize_toc_entries(toc_entries, section_entries)
+        logger.info(f"TOC 파싱 완료 (outline): {len(toc_entries)}개 항목")
+        _toc_cache[key] = (stamp, ([dict(e) for e in toc_entries], -1))
+        return toc_entries, -1
+
+    page_count = _pdf_page_count(filepath)
     toc_entries: list[dict] = []
     section_entries: list[dict] = []
 
     # 목차 페이지 탐색 — 가장 많은 항목이 있는 페이지를 선택
     best_page_idx = -1
     best_count = 0
-    for i in range(25, min(50, len(pdf.pages))):
-        text = pdf.pages[i].extract_text() or ""
+    for i in range(25, min(50, page_count)):
+        text = _page_text(filepath, i)
         if "일반원칙" in text and "암종별" in text:
             count = len(list(_TOC_ENTRY_START.finditer(text)))
             if count > best_count:
@@ -553,7 +1169,7 @@ def _parse_toc(filepath: Path) -> tuple[list[dict], int]:
                 best_page_idx = i
 
     if best_page_idx >= 0:
-        text = pdf.pages[best_page_idx].extract_text() or ""
+        text = _page_text(filepath, best_page_idx)
 
         # 섹션 레벨 항목 추출
         for match in _TOC_SECTION_PATTERN.finditer(text):
@@ -568,8 +1184,17 @@ def _parse_toc(filepath: Path) -> tuple[list[dict], int]:
             entries = _parse_toc_entries_from_line(line)
             toc_entries.extend(entries)
 
-    pdf.close()
+    toc_entries = _finalize_toc_entries(toc_entries, section_entries)
 
+    logger.info(f"TOC 파싱 완료: {len(toc_entries)}개 항목, TOC page idx={best_page_idx}")
+    _toc_cache[key] = (stamp, ([dict(e) for e in toc_entries], best_page_idx))
+    return toc_entries, best_page_idx
+
+
+def _finalize_toc_entries(
+    toc_entries: list[dict], section_entries: list[dict]
+) -> list[dict]:
+    """TOC 항목을 페이지 순 정렬·중복 제거하고 end_page를 채웁니다."""
     # 페이지 번호 순 정렬 (두 컬럼이 섞여있으므로)
     toc_entries.sort(key=lambda e: e["page"])
 
@@ -595,8 +1220,7 @@ def _parse_toc(filepath: Path) -> tuple[list[dict], int]:
                     break
             entry["end_page"] = (next_section_page - 1) if next_section_page else entry["page"] + 10
 
-    logger.info(f"TOC 파싱 완료: {len(toc_entries)}개 항목, TOC page idx={best_page_idx}")
-    return toc_entries, best_page_idx
+    return toc_entries
 
 
 def _find_cancer_pages(
@@ -621,23 +1245,29 @@ def _find_cancer_pages(
         if query in entry["name"]:
             return _resolve(entry)
 
-    # 2단계: 영문 별칭 매칭
-    for korean_name, aliases in _CANCER_ALIASES.items():
-        if query in korean_name or any(alias in query for alias in aliases):
-            for entry in toc:
-                if korean_name in entry["name"]:
-                    return _resolve(entry)
-
-    # 3단계: 부분 매칭 (가장 유사한 항목)
-    for entry in toc:
-        entry_lower = entry["name"].lower()
-        if any(c in entry_lower for c in query if len(c) > 1):
-            return _resolve(entry)
+    # 2단계: 영문 별칭 매칭 (긴 별칭 우선) → 한글 이름 부분 매칭
+    aliases = sorted(
+        (m.group() for m in _CANCER_ALIAS_RE.finditer(query)), key=len, reverse=True
+    )
+    candidates = [name for alias in aliases for name in _ALIAS_TO_CANCERS[alias]]
+    candidates.extend(name for name in _CANCER_ALIASES if query in name)
+    for korean_name in candidates:
+        for entry in toc:
+            if korean_name in entry["name"]:
+                return _resolve(entry)
 
     return [], ""
 
 
-_toc_offset_cache: dict[str, int] = {}
+# 파일별 TOC 오프셋 — {path: (stamp, offset)}
+_toc_offset_cache: dict[str, tuple[tuple[int, int], int]] = {}
+
+
+def _footer_page_number(text: str) -> int | None:
+    """페이지 텍스트의 마지막 비어있지 않은 줄이 숫자면 그 값을 반환합니다."""
+    last_line = text.rstrip().rpartition("\n")[2].strip()
+    match = _FOOTER_PAGE_NUM.fullmatch(last_line)
+    return int(match.group()) if match else None
 
 
 def _calc_toc_offset(
@@ -650,28 +1280,20 @@ def _calc_toc_offset(
     offset = pdf_idx - printed_number + 1 로 계산.
     """
     cache_key = str(filepath)
-    if cache_key in _toc_offset_cache:
-        return _toc_offset_cache[cache_key]
-
-    import pdfplumber
+    stamp = _file_stamp(filepath)
+    cached = _toc_offset_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
-    pdf = pdfplumber.open(str(filepath))
+    page_count = _pdf_page_count(filepath)
 
     # 방법 1: TOC 직후 페이지의 footer 번호로 오프셋 계산
     if toc_page_idx >= 0:
-        for scan_idx in range(toc_page_idx + 1, min(toc_page_idx + 5, len(pdf.pages))):
-            text = pdf.pages[scan_idx].extract_text() or ""
-            lines = [ln.strip() for ln in text.strip().split("\n") if ln.strip()]
-            if not lines:
-                continue
-            # footer: 마지막 줄이 숫자만 있는 경우
-            last_line = lines[-1]
-            footer_match = re.match(r"^(\d+)$", last_line)
-            if footer_match:
-                footer_num = int(footer_match.group(1))
+        for scan_idx in range(toc_page_idx + 1, min(toc_page_idx + 5, page_count)):
+            footer_num = _footer_page_number(_page_text(filepath, scan_idx))
+            if footer_num is not None:
                 offset = scan_idx - footer_num + 1
-                _toc_offset_cache[cache_key] = offset
-                pdf.close()
+                _toc_offset_cache[cache_key] = (stamp, offset)
                 logger.info(
                     f"TOC 오프셋 계산 (footer): {offset} "
                     f"(PDF idx={scan_idx}, footer={footer_num})"
@@ -679,24 +1301,19 @@ def _calc_toc_offset(
                 return offset
 
     # 방법 2 (fallback): "일반원칙" 텍스트 위치 + TOC/section 항목 대조
-    for i in range(30, min(50, len(pdf.pages))):
-        text = (pdf.pages[i].extract_text() or "")[:500]
+    for i in range(30, min(50, page_count)):
+        text = _page_text(filepath, i)[:500]
         if "일반원칙" in text:
             # footer 번호 확인
-            lines = [ln.strip() for ln in text.strip().split("\n") if ln.strip()]
-            footer_match = re.match(r"^(\d+)$", lines[-1]) if lines else None
-            if footer_match:
-                footer_num = int(footer_match.group(1))
+            footer_num = _footer_page_number(text)
+            if footer_num is not None:
                 offset = i - footer_num + 1
-                _toc_offset_cache[cache_key] = offset
-                pdf.close()
+                _toc_offset_cache[cache_key] = (stamp, offset)
                 logger.info(f"TOC 오프셋 계산 (일반원칙 fallback): {offset}")
                 return offset
 
-    pdf.close()
-
     # 최후 fallback
-    _toc_offset_cache[cache_key] = 33
+    _toc_offset_cache[cache_key] = (stamp, 33)
     logger.warning("TOC 오프셋 계산 실패, 기본값 33 사용")
     return 33
 
@@ -708,7 +1325,14 @@ def _toc_page_to_indices(
 ) -> tuple[int, int]:
     """
     TOC 페이지 번호(PDF 내부 번호)를 0-indexed 페이지 인덱스로 변환합니다.
+
+    outline 항목은 이미 실제 PDF 페이지이므로 오프셋·퍼지 보정을 하지 않습니다.
     """
+    if entry.get("outline"):
+        start_idx = max(0, min(entry["page"] - 1, total_pages - 1))
+        end_idx = max(start_idx, min(entry["end_page"] - 1, total_pages - 1))
+        return start_idx, end_idx
+
     offset = _calc_toc_offset(filepath, toc, toc_page_idx) if filepath else 33
 
     start_idx = entry["page"] + offset - 1  # 0-indexed
@@ -738,34 +1362,28 @@ def _verify_page_with_fuzzy(
     예상 페이지 ±search_range 범위에서 암종명을 검색하여 실제 시작 페이지를 반환합니다.
     찾지 못하면 원래 expected_idx를 반환합니다.
     """
-    import pdfplumber
-
     # 짧은 이름 추출 (예: "난소암/난관암/일차복막암" → ["난소암", "난관암"])
     name_parts = [p.strip() for p in cancer_name.replace("/", "|").split("|") if len(p.strip()) >= 2]
     if not name_parts:
         return expected_idx
 
-    pdf = pdfplumber.open(str(filepath))
-    try:
-        # 예상 페이지 먼저 확인
-        if 0 <= expected_idx < total_pages:
-            text = (pdf.pages[expected_idx].extract_text() or "")[:500]
-            if any(part in text for part in name_parts):
-                return expected_idx
-
-        # ±search_range 탐색
-        for delta in range(1, search_range + 1):
-            for candidate in [expected_idx + delta, expected_idx - delta]:
-                if 0 <= candidate < total_pages:
-                    text = (pdf.pages[candidate].extract_text() or "")[:500]
-                    if any(part in text for part in name_parts):
-                        logger.info(
-                            f"퍼지 검증: '{cancer_name}' 페이지 조정 "
-                            f"{expected_idx} → {candidate}"
-                        )
-                        return candidate
-    finally:
-        pdf.close()
+    # 예상 페이지 먼저 확인
+    if 0 <= expected_idx < total_pages:
+        text = _page_text(filepath, expected_idx)[:500]
+        if any(part in text for part in name_parts):
+            return expected_idx
+
+    # ±search_range 탐색
+    for delta in range(1, search_range + 1):
+        for candidate in [expected_idx + delta, expected_idx - delta]:
+            if 0 <= candidate < total_pages:
+                text = _page_text(filepath, candidate)[:500]
+                if any(part in text for part in name_parts):
+                    logger.info(
+                        f"퍼지 검증: '{cancer_name}' 페이지 조정 "
+                        f"{expected_idx} → {candidate}"
+                    )
+                    return candidate
 
     return expected_idx
 
@@ -791,39 +1409,32 @@ def _find_section_pages_by_scan(
     filepath: Path, section: str, total_pages: int
 ) -> list[int]:
     """PDF 전체를 스캔하여 섹션 페이지를 찾습니다 (폴백)."""
-    import pdfplumber
-
-    keywords = PDF_SECTIONS.get(section, [section])
-    pdf = pdfplumber.open(str(filepath))
+    keyword_re = _SECTION_KEYWORD_RES.get(section) or re.compile(re.escape(section))
     start_page = None
 
-    for i, page in enumerate(pdf.pages):
-        text = (page.extract_text() or "").strip()
+    for i in range(_pdf_page_count(filepath)):
+        text = _page_text(filepath, i).strip()
         if not text:
             continue
-        header = text[:500]
-        if any(kw in header for kw in keywords):
+        if keyword_re.search(text, 0, 500):
             start_page = i
             break
 
     if start_page is None:
-        pdf.close()
         return []
 
     # 다음 섹션 시작점 탐색
     end_page = min(start_page + 50, total_pages - 1)
-    other_keywords = []
-    for sec_name, sec_kws in PDF_SECTIONS.items():
-        if sec_name != section:
-            other_keywords.extend(sec_kws)
+    other_re = _OTHER_SECTION_RES.get(section) or re.compile(
+        "|".join(re.escape(kw) for kws in PDF_SECTIONS.values() for kw in kws)
+    )
 
     for i in range(start_page + 1, min(start_page + 100, total_pages)):
-        text = (pdf.pages[i].extract_text() or "").strip()
-        if any(kw in text[:500] for kw in other_keywords):
+        text = _page_text(filepath, i).strip()
+        if other_re.search(text, 0, 500):
             end_page = i - 1
             break
 
-    pdf.close()
     return list(range(start_page, end_page + 1))
 
 
@@ -838,19 +1449,16 @@ def _search_pdf(
     filepath: Path, keyword: str, total_pages: int
 ) -> list[TextContent]:
     """PDF 전체에서 키워드를 검색하여 매칭 페이지와 주변 텍스트를 반환합니다."""
-    import pdfplumber
-
-    pdf = pdfplumber.open(str(filepath))
     matches: list[dict] = []
     keyword_lower = keyword.lower()
 
-    for i, page in enumerate(pdf.pages):
+    for i in range(_pdf_page_count(filepath)):
         if len(matches) >= _SEARCH_MAX_RESULTS:
             break
-        text = page.extract_text() or ""
-        if keyword_lower in text.lower():
+        text = _page_text(filepath, i)
+        idx = text.lower().find(keyword_lower)
+        if idx >= 0:
             # 매칭 위치의 주변 텍스트 추출
-            idx = text.lower().index(keyword_lower)
             start = max(0, idx - _SEARCH_CONTEXT_CHARS)
             end = min(len(text), idx + len(keyword) + _SEARCH_CONTEXT_CHARS)
             context = text[start:end].strip()
@@ -860,8 +1468,6 @@ def _search_pdf(
                 context = context + "…"
             matches.append({"page": i + 1, "context": context})
 
-    pdf.close()
-
     if not matches:
         return [TextContent(
             type="text",
@@ -920,20 +1526,23 @@ def _parse_page_range(pages_str: str, total: int) -> list[int]:
       - "1-10"    → [0,1,...,9]
       - "1,3,7-10" → [0,2,6,7,8,9]
     """
-    result: list[int] = []
+    # 페이지별 선택 마스크 — 중복 제거와 정렬이 따로 필요 없고,
+    # 큰 범위("1-100000")도 total 크기 이상 메모리를 쓰지 않음
+    mask = bytearray(max(total, 0))
     for part in pages_str.split(","):
         part = part.strip()
         if "-" in part:
             start_s, end_s = part.split("-", 1)
             start = max(int(start_s.strip()) - 1, 0)
             end = min(int(end_s.strip()) - 1, total - 1)
-            result.extend(range(start, end + 1))
+            if start <= end:
+                mask[start:end + 1] = b"\x01" * (end - start + 1)
         else:
             idx = int(part) - 1
             if 0 <= idx < total:
-                result.append(idx)
+                mask[idx] = 1
 
-    return sorted(set(result))
+    return list(compress(range(len(mask)), mask))
 
 
 def _format_page_range(indices: list[int]) -> str:
@@ -941,25 +1550,12 @@ def _format_page_range(indices: list[int]) -> str:
     if not indices:
         return "(없음)"
 
-    # 연속 구간 탐지
+    # 연속 구간 탐지 — 연속된 값은 (값 - 위치)가 같으므로 한 그룹으로 묶임
     ranges: list[str] = []
-    start = indices[0]
-    prev = indices[0]
-
-    for i in indices[1:]:
-        if i == prev + 1:
-            prev = i
-        else:
-            if start == prev:
-                ranges.append(f"p.{start + 1}")
-            else:
-                ranges.append(f"p.{start + 1}-{prev + 1}")
-            start = i
-            prev = i
-
-    if start == prev:
-        ranges.append(f"p.{start + 1}")
-    else:
-        ranges.append(f"p.{start + 1}-{prev + 1}")
+    for _, run in groupby(enumerate(indices), key=lambda iv: iv[1] - iv[0]):
+        start = end = next(run)[1]
+        for _, end in run:
+            pass
+        ranges.append(f"p.{start + 1}" if start == end else f"p.{start + 1}-{end + 1}")
 
     return ", ".join(ranges)
@@ -17,10 +17,18 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # 빠른 JSON 직렬화 (scheduler_config.json)
+except ImportError:  # pragma: no cover - 선택 의존성 미설치 환경
+    orjson = None
+
+from .scraper import check_for_updates
+
 logger = logging.getLogger(__name__)
 
 KST = timezone(timedelta(hours=9))
@@ -53,6 +61,9 @@ class HiraScheduler:
         self._running: bool = False
         self._last_result: dict | None = None
         self._last_run: str | None = None
+        self._next_run_at: datetime | None = None  # 루프가 대기 중인 다음 실행 시각
+        self._saved_config: bytes | None = None  # 마지막으로 디스크에 쓴 설정 내용
+        self._wakeup = asyncio.Event()  # 설정 변경 시 대기 중인 루프를 깨움
 
         self._load_config()
 
@@ -60,36 +71,50 @@ class HiraScheduler:
 
     def _load_config(self) -> None:
         """저장된 설정이 있으면 로드합니다."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-                self._enabled = cfg.get("enabled", True)
-                self.check_hour = cfg.get("check_hour", DEFAULT_CHECK_HOUR)
-                self.check_minute = cfg.get("check_minute", DEFAULT_CHECK_MINUTE)
-                self._last_run = cfg.get("last_run")
-                logger.info(f"스케줄러 설정 로드: enabled={self._enabled}, "
-                           f"시각={self.check_hour:02d}:{self.check_minute:02d}")
-            except Exception as e:
-                logger.warning(f"설정 로드 실패: {e}")
+        try:
+            raw = self.config_path.read_bytes()
+            cfg = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._enabled = cfg.get("enabled", True)
+            self.check_hour = cfg.get("check_hour", DEFAULT_CHECK_HOUR)
+            self.check_minute = cfg.get("check_minute", DEFAULT_CHECK_MINUTE)
+            self._last_run = cfg.get("last_run")
+            logger.info(f"스케줄러 설정 로드: enabled={self._enabled}, "
+                       f"시각={self.check_hour:02d}:{self.check_minute:02d}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"설정 로드 실패: {e}")
 
     def _save_config(self) -> None:
-        """현재 설정을 저장합니다."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        """
+        현재 설정을 저장합니다.
+
+        내용이 마지막 저장과 같으면 쓰지 않고, 임시 파일에 쓴 뒤 os.replace로
+        교체합니다 (중단 시에도 기존 파일 보존).
+        """
         cfg = {
             "enabled": self._enabled,
             "check_hour": self.check_hour,
             "check_minute": self.check_minute,
             "last_run": self._last_run,
         }
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(cfg, ensure_ascii=False, indent=2).encode("utf-8")
+        if data == self._saved_config:
+            return
+
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.config_path)
+        self._saved_config = data
 
     # ── Core scheduling loop ─────────────────────────────────────────
 
-    def _seconds_until_next_run(self) -> float:
-        """다음 실행까지 남은 초를 계산합니다."""
-        now = datetime.now(KST)
+    def _next_run_time(self, now: datetime) -> datetime:
+        """now 이후 가장 가까운 체크 시각을 계산합니다."""
         target = now.replace(
             hour=self.check_hour,
             minute=self.check_minute,
@@ -98,12 +123,10 @@ class HiraScheduler:
         )
         if target <= now:
             target += timedelta(days=1)
-        return (target - now).total_seconds()
+        return target
 
     async def _run_check(self) -> dict:
         """업데이트 확인을 실행합니다."""
-        from .scraper import check_for_updates
-
         logger.info("스케줄된 업데이트 확인 시작…")
         try:
             results = await check_for_updates(self.data_dir)
@@ -123,14 +146,27 @@ class HiraScheduler:
         )
 
         while self._running:
-            wait = self._seconds_until_next_run()
+            now = datetime.now(KST)
+            self._next_run_at = self._next_run_time(now)
+            wait = (self._next_run_at - now).total_seconds()
             logger.info(f"다음 실행까지 {wait/3600:.1f}시간 대기")
 
             try:
-                await asyncio.sleep(wait)
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
             except asyncio.CancelledError:
                 logger.info("스케줄러 루프 취소됨")
+                self._next_run_at = None
                 break
+            else:
+                # 설정 변경으로 깨어남 — 새 설정 기준으로 다시 계산
+                self._wakeup.clear()
+                continue
+
+            # 긴 대기 중 벽시계와 어긋나 일찍 깨어난 경우 남은 시간만큼 다시 대기
+            if datetime.now(KST) < self._next_run_at:
+                continue
 
             if self._enabled and self._running:
                 await self._run_check()
@@ -157,12 +193,14 @@ class HiraScheduler:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        self._next_run_at = None
         logger.info("스케줄러 중지됨")
 
     def enable(self) -> dict:
         """스케줄러를 활성화합니다 (on)."""
         self._enabled = True
         self._save_config()
+        self._wakeup.set()
         logger.info("스케줄러 활성화됨 (ON)")
         return self.get_status()
 
@@ -170,6 +208,7 @@ class HiraScheduler:
         """스케줄러를 비활성화합니다 (off)."""
         self._enabled = False
         self._save_config()
+        self._wakeup.set()
         logger.info("스케줄러 비활성화됨 (OFF)")
         return self.get_status()
 
@@ -177,18 +216,27 @@ class HiraScheduler:
         """체크 시각을 변경합니다."""
         self.check_hour = hour
         self.check_minute = minute
+        self._next_run_at = None  # 새 시각 기준으로 다시 계산
         self._save_config()
+        self._wakeup.set()
         logger.info(f"체크 시각 변경: {hour:02d}:{minute:02d} KST")
         return self.get_status()
 
     def get_status(self) -> dict:
         """스케줄러 상태를 반환합니다."""
-        wait = self._seconds_until_next_run() if self._running else None
+        wait = None
+        if self._running:
+            now = datetime.now(KST)
+            # 실행 중에는 방금 도래한 시각이 남아 있으므로 미래 시각일 때만 재사용
+            next_at = self._next_run_at
+            if next_at is None or next_at <= now:
+                next_at = self._next_run_time(now)
+            wait = (next_at - now).total_seconds()
         return {
             "enabled": self._enabled,
             "running": self._running,
             "schedule": f"{self.check_hour:02d}:{self.check_minute:02d} KST (매일)",
-            "next_run_in": f"{wait/3600:.1f}시간" if wait else "중지됨",
+            "next_run_in": f"{wait/3600:.1f}시간" if wait is not None else "중지됨",
             "last_run": self._last_run,
             "last_result_summary": self._summarize_last(),
         }
@@ -197,6 +245,8 @@ class HiraScheduler:
         """마지막 결과를 요약합니다."""
         if not self._last_result:
             return None
+        if self._last_result.get("any_update") is False:
+            return "변경 없음"
         files = self._last_result.get("files", {})
         updates = [k for k, v in files.items() if v.get("has_update")]
         if updates:
@@ -25,9 +25,17 @@ import logging
 import os
 import re
 import shutil
+import threading
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+try:
+    import orjson  # 빠른 JSON 직렬화 (metadata.json)
+except ImportError:  # pragma: no cover - 선택 의존성 미설치 환경
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -77,26 +85,144 @@ FILE_IDENTIFIERS: dict[str, list[list[str]]] = {
 # 하위 호환용: 단일 키워드 리스트가 필요한 곳에서 사용
 FILE_KEYS = list(FILE_IDENTIFIERS.keys())
 
+# 링크 텍스트 사전 필터 — 어떤 키워드도 없으면 키워드 조합 검사를 생략
+_FILE_KEYWORD_RE = re.compile("|".join(
+    re.escape(kw)
+    for keyword_sets in FILE_IDENTIFIERS.values()
+    for keywords in keyword_sets
+    for kw in keywords
+))
+
+# 키워드 조합별 매처 — 조합의 모든 키워드를 전방탐색으로 묶어 search 한 번에 검사
+_FILE_MATCHERS: dict[str, list[re.Pattern[str]]] = {
+    key: [
+        re.compile("".join(f"(?=.*{re.escape(kw)})" for kw in keywords), re.S)
+        for keywords in keyword_sets
+    ]
+    for key, keyword_sets in FILE_IDENTIFIERS.items()
+}
+
+# 링크/행 텍스트의 게시일 (예: "2025.1.15.") — 날짜가 있는 텍스트만 변경 판단에 사용
+_POSTING_DATE_RE = re.compile(r"\d{4}\.\s*\d{1,2}\.\s*\d{1,2}")
+
+# 파일명에 사용할 수 없는 문자 → "_" 변환표
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('\\/*?:"<>|', "_"))
+
 # Playwright 브라우저 공통 설정
 _BROWSER_UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/131.0.0.0 Safari/537.36"
 )
+# 영속 브라우저 프로필 디렉토리 (data_dir 하위) — HTTP 캐시·쿠키 재사용
+_PROFILE_DIRNAME = "_pw_profile"
+# 스크래핑에 필요 없는 백그라운드 기능을 꺼서 Chromium 시작/로드 시간을 줄임
+_BROWSER_ARGS = [
+    "--disk-cache-size=104857600",
+    "--disable-features=TranslateUI,MediaRouter,OptimizationHints",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-dev-shm-usage",
+]
+# 분석/광고 트래커 요청은 차단 (대역폭 절약, networkidle 대기 단축)
+_TRACKER_URL_RE = re.compile(
+    r"^https?://([^/]*\.)?("
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|"
+    r"googlesyndication\.com|hotjar\.com|facebook\.net|wcs\.naver\.net"
+    r")/"
+)
+
+# 페이지 로드 후 대상 파일 링크가 렌더링될 때까지 기다리는 셀렉터 (각 파일의 최종 폴백 키워드)
+# _find_clickable_elements가 찾는 요소 종류(a, button, onclick)를 모두 포함
+_FILE_LINK_SELECTOR = (
+    ":is(a, button, [onclick]):has-text('허가초과'), "
+    ":is(a, button, [onclick]):has-text('공고내용')"
+)
+_FILE_LINK_TIMEOUT = 10_000
+
+# HEAD 조건부 요청 타임아웃 (초)
+_HEAD_TIMEOUT = 15.0
+
+# 동시 다운로드 최대 개수 (HIRA 서버 부하 방지)
+_MAX_CONCURRENT_DOWNLOADS = 3
+
+# 파일별로 metadata.json에 보관할 이전 버전 기록 수 (오래된 기록부터 삭제)
+_MAX_HISTORY = 50
 
 
 # ─────────────────────────────────────────────────────────────────────
 # 유틸리티
 # ─────────────────────────────────────────────────────────────────────
+def _new_sha256():
+    """변경 감지용 SHA-256 객체 (보안 용도가 아니므로 FIPS 제약 없이 가장 빠른 구현 사용)."""
+    return hashlib.sha256(usedforsecurity=False)
+
+
 def sha256_of(filepath: Path) -> str:
     """파일의 SHA-256 해시를 반환합니다."""
-    h = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+    # 1 MiB 단위로 직접 읽으므로 BufferedReader를 거치지 않음 (buffering=0)
+    with open(filepath, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: 큰 버퍼 + GIL 해제
+            return hashlib.file_digest(f, _new_sha256).hexdigest()
+        h = _new_sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
+def _copy_and_hash(src: Path, dest: Path) -> tuple[str, int]:
+    """
+    src를 dest로 복사하면서 SHA-256을 함께 계산합니다.
+
+    Returns:
+        (sha256 hex, 바이트 수) — 복사 후 dest를 다시 읽어 해시하지 않음
+    """
+    h = _new_sha256()
+    size = 0
+    with open(src, "rb", buffering=0) as fin, open(dest, "wb") as fout:
+        while chunk := fin.read(1 << 20):
+            h.update(chunk)
+            fout.write(chunk)
+            size += len(chunk)
+    return h.hexdigest(), size
+
+
+def _move_and_hash(src: Path, dest: Path) -> tuple[str, int]:
+    """
+    src를 dest로 옮기고 SHA-256을 계산합니다.
+
+    같은 파일시스템이면 이름만 바꾸고(데이터 복사 없음) dest를 한 번 읽어 해시하며,
+    다른 파일시스템이면 복사하면서 해시합니다.
+
+    Returns:
+        (sha256 hex, 바이트 수)
+    """
+    try:
+        os.replace(src, dest)
+    except OSError:
+        return _copy_and_hash(src, dest)
+    return sha256_of(dest), dest.stat().st_size
+
+
+def _link_latest(src: Path, latest: Path) -> None:
+    """
+    latest를 src의 하드링크로 교체합니다 (다운로드 파일은 이후 수정되지 않음).
+
+    하드링크를 만들 수 없는 파일시스템이면 복사로 대체합니다. 임시 이름으로 만든 뒤
+    os.replace로 교체하므로 latest 경로가 잠시라도 비는 일이 없습니다.
+    """
+    tmp = latest.with_name(latest.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copy2(src, tmp)
+    os.replace(tmp, latest)
+
+
 def now_kst() -> str:
     """현재 KST 시각을 ISO 8601 문자열로 반환합니다."""
     return datetime.now(KST).isoformat(timespec="seconds")
@@ -104,7 +230,7 @@ def now_kst() -> str:
 
 def _sanitize(name: str) -> str:
     """파일명에 사용할 수 없는 문자를 제거합니다."""
-    return re.sub(r'[\\/*?:"<>|]', "_", name).strip()
+    return name.translate(_UNSAFE_FILENAME_CHARS).strip()
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -122,11 +248,20 @@ class MetadataStore:
           "sha256": "abc123...",
           "size": 123456,
           "downloaded_at": "2025-02-03T14:30:22+09:00",
-          "source_text": "허가초과 항암요법(2025.1.15.)"
+          "source_text": "허가초과 항암요법(2025.1.15.)",
+          "download_url": "https://www.hira.or.kr/...",
+          "etag": "\"5f3a…\"",
+          "last_modified": "Wed, 15 Jan 2025 01:00:00 GMT"
         },
         "history": [ { ... }, ... ]
       },
-      ...
+      ...,
+      "section_cache": {
+        "<sha256>": { "일반원칙": [33, 34, ...], ... }
+      },
+      "cancer_cache": {
+        "<sha256>": { "<cancer_type>": { "pages": [120, 121, ...], "name": "유방암" }, ... }
+      }
     }
     """
 
@@ -134,19 +269,70 @@ class MetadataStore:
         self.data_dir = data_dir
         self.meta_path = data_dir / "metadata.json"
         self._data: dict[str, Any] = {}
+        self._saved: bytes | None = None  # 마지막으로 읽거나 쓴 metadata.json 내용
+        self._stamp: tuple[int, int] | None = None  # 그때의 (mtime_ns, size)
+        # 리더의 파싱 워커 스레드도 탐색 캐시를 기록하므로 갱신·저장을 직렬화
+        self._lock = threading.RLock()
         self._load()
 
+    @classmethod
+    def for_dir(cls, data_dir: Path) -> MetadataStore:
+        """
+        data_dir별로 공유되는 MetadataStore를 반환합니다.
+
+        metadata.json이 마지막으로 읽거나 쓴 뒤 바뀌지 않았으면 다시 파싱하지 않고,
+        다른 프로세스(CLI, 데몬 등)가 수정했으면 다시 읽습니다.
+        """
+        key = Path(data_dir).resolve()
+        store = _metadata_stores.get(key)
+        if store is None:
+            store = _metadata_stores[key] = cls(data_dir)
+        else:
+            store._reload_if_changed()
+        return store
+
     # ── persistence ──────────────────────────────────────────────────
 
+    def _file_stamp(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.meta_path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _reload_if_changed(self) -> None:
+        with self._lock:
+            if self._file_stamp() != self._stamp:
+                self._load()
+
     def _load(self) -> None:
-        if self.meta_path.exists():
-            with open(self.meta_path, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
+        try:
+            raw = self.meta_path.read_bytes()
+        except FileNotFoundError:
+            return
+        self._data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        self._saved = raw
+        self._stamp = self._file_stamp()
 
     def _save(self) -> None:
+        """
+        임시 파일에 쓴 뒤 os.replace로 교체합니다 (중단 시에도 기존 파일 보존).
+
+        직렬화 결과가 디스크 내용과 같으면 쓰지 않습니다.
+        """
+        if orjson is not None:
+            data = orjson.dumps(self._data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self._data, ensure_ascii=False, indent=2).encode("utf-8")
+        if data == self._saved:
+            return
+
         self.meta_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.meta_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        tmp_path = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.meta_path)
+        self._saved = data
+        self._stamp = self._file_stamp()
 
     # ── accessors ────────────────────────────────────────────────────
 
@@ -158,15 +344,92 @@ class MetadataStore:
 
     def update(self, file_key: str, record: dict) -> None:
         """새 레코드를 current로 설정하고, 기존 current는 history로 밀어넣습니다."""
-        if file_key not in self._data:
-            self._data[file_key] = {"current": None, "history": []}
-
-        old_current = self._data[file_key]["current"]
-        if old_current is not None:
-            self._data[file_key]["history"].insert(0, old_current)
+        self.update_many({file_key: record})
+
+    def update_many(self, records: dict[str, dict]) -> None:
+        """여러 파일의 레코드를 한 번에 갱신하고 metadata.json은 한 번만 씁니다."""
+        if not records:
+            return
+
+        with self._lock:
+            for file_key, record in records.items():
+                if file_key not in self._data:
+                    self._data[file_key] = {"current": None, "history": []}
+
+                old_current = self._data[file_key]["current"]
+                if old_current is not None:
+                    history = self._data[file_key]["history"]
+                    history.insert(0, old_current)
+                    del history[_MAX_HISTORY:]
+
+                self._data[file_key]["current"] = record
+
+            self._save()
+
+    def refresh_many(self, fields: dict[str, dict]) -> None:
+        """
+        현재 레코드의 일부 필드(검증자 등)를 갱신합니다 — 파일이 같으므로 이력은 남기지 않음.
+
+        현재 레코드가 없는 파일은 건너뛰고, metadata.json은 한 번만 씁니다.
+        """
+        if not fields:
+            return
+
+        with self._lock:
+            for file_key, values in fields.items():
+                current = self._data.get(file_key, {}).get("current")
+                if current is not None:
+                    current.update(values)
+            self._save()
+
+    # ── PDF 섹션/암종 탐색 캐시 ──────────────────────────────────────
+
+    def get_section_cache(self, sha256: str, section: str) -> list[int] | None:
+        """파일 해시 기준으로 저장된 섹션 페이지 인덱스를 반환합니다."""
+        return self._data.get("section_cache", {}).get(sha256, {}).get(section)
+
+    def set_section_cache(self, sha256: str, section: str, indices: list[int]) -> None:
+        """섹션 페이지 인덱스를 파일 해시 기준으로 저장합니다."""
+        self._set_hash_cache("section_cache", sha256, section, list(indices))
+
+    def get_cancer_cache(self, sha256: str, cancer_type: str) -> dict | None:
+        """
+        파일 해시 기준으로 저장된 암종 탐색 결과를 반환합니다.
+
+        Returns:
+            {"pages": [0-indexed 페이지], "name": 목차상 암종명} 또는 None
+        """
+        return self._data.get("cancer_cache", {}).get(sha256, {}).get(cancer_type)
+
+    def set_cancer_cache(
+        self, sha256: str, cancer_type: str, indices: list[int], matched_name: str
+    ) -> None:
+        """암종 탐색 결과(페이지 인덱스, 매칭된 목차 항목명)를 파일 해시 기준으로 저장합니다."""
+        self._set_hash_cache(
+            "cancer_cache", sha256, cancer_type, {"pages": list(indices), "name": matched_name}
+        )
 
-        self._data[file_key]["current"] = record
-        self._save()
+    def _set_hash_cache(self, cache_name: str, sha256: str, key: str, value: Any) -> None:
+        """
+        {sha256: {key: value}} 형태의 캐시에 값을 저장합니다.
+
+        현재 파일의 해시가 아닌 항목(구버전 PDF)은 이때 함께 정리됩니다.
+        """
+        with self._lock:
+            self._reload_if_changed()  # 그 사이 다른 프로세스가 기록한 메타데이터 반영
+            current_hashes = {
+                cur["sha256"]
+                for file_key in FILE_IDENTIFIERS
+                if (cur := self.get_current(file_key)) and cur.get("sha256")
+            }
+            cache = {
+                h: entries
+                for h, entries in self._data.get(cache_name, {}).items()
+                if h in current_hashes
+            }
+            cache.setdefault(sha256, {})[key] = value
+            self._data[cache_name] = cache
+            self._save()
 
     def get_all_status(self) -> dict:
         """모든 파일의 현재 상태를 요약합니다."""
@@ -181,18 +444,138 @@ class MetadataStore:
         return result
 
 
+# MetadataStore.for_dir 캐시 — {해석된 data_dir: MetadataStore}
+_metadata_stores: dict[Path, MetadataStore] = {}
+
+
 # ─────────────────────────────────────────────────────────────────────
 # Playwright helpers
 # ─────────────────────────────────────────────────────────────────────
-async def ensure_playwright() -> None:
-    """Playwright chromium이 설치되어 있는지 확인하고, 없으면 설치합니다."""
-    try:
+# 프로세스 단위로 공유되는 브라우저 상태 (get_browser_context 참고)
+_playwright = None
+_browser = None
+_context = None
+_context_lock: asyncio.Lock | None = None
+# ensure_playwright에서 지정한 영속 프로필 경로 (컨텍스트는 첫 사용 시 실행)
+_profile_dir: Path | None = None
+
+
+async def get_browser_context(profile_dir: Path | None = None):
+    """
+    프로세스 전체에서 공유하는 Playwright BrowserContext를 반환합니다.
+
+    최초 호출 시에만 Chromium을 실행하고 이후에는 같은 컨텍스트를 재사용합니다.
+    브라우저가 비정상 종료(크래시·OOM·연결 끊김)되면 close/disconnected 이벤트로
+    캐시를 비우므로, 다음 호출에서 다시 실행됩니다.
+    profile_dir이 주어지면 launch_persistent_context로 실행하여 HTTP 캐시와
+    쿠키가 다음 실행(cron의 CLI 재호출 등)까지 보존됩니다.
+    생략하면 ensure_playwright에서 지정한 프로필을 사용합니다.
+    """
+    global _playwright, _browser, _context, _context_lock
+
+    if profile_dir is None:
+        profile_dir = _profile_dir
+    if _context_lock is None:
+        _context_lock = asyncio.Lock()
+
+    async with _context_lock:
+        if _context is not None:
+            return _context
+
+        # 이전 컨텍스트가 비정상 종료되었으면 남은 브라우저·드라이버부터 정리
+        if _browser is not None:
+            try:
+                await _browser.close()
+            except Exception:
+                pass
+            _browser = None
+        if _playwright is not None:
+            try:
+                await _playwright.stop()
+            except Exception:
+                pass
+            _playwright = None
+
         from playwright.async_api import async_playwright
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+        _playwright = await async_playwright().start()
+        try:
+            context = None
+            if profile_dir is not None:
+                try:
+                    context = await _playwright.chromium.launch_persistent_context(
+                        str(profile_dir),
+                        headless=True,
+                        user_agent=_BROWSER_UA,
+                        accept_downloads=True,
+                        args=_BROWSER_ARGS,
+                    )
+                except Exception as exc:
+                    # 다른 프로세스(데몬 등)가 같은 프로필을 사용 중인 경우
+                    logger.warning(f"영속 브라우저 프로필 사용 불가, 임시 컨텍스트 사용: {exc}")
+
+            if context is None:
+                _browser = await _playwright.chromium.launch(headless=True, args=_BROWSER_ARGS)
+                context = await _browser.new_context(
+                    user_agent=_BROWSER_UA,
+                    accept_downloads=True,
+                )
+                _browser.on("disconnected", lambda _b: _forget_context(context))
+            context.on("close", _forget_context)
+            await context.route(_TRACKER_URL_RE, _abort_route)
+            _context = context
+            return _context
+        except BaseException:
+            await _playwright.stop()
+            _playwright = None
+            raise
+
+
+def _forget_context(context) -> None:
+    """공유 컨텍스트가 닫히면 캐시를 비워 다음 get_browser_context에서 다시 실행합니다."""
+    global _context
+    if _context is context:
+        logger.warning("브라우저 컨텍스트가 종료됨 — 다음 요청에서 다시 실행합니다")
+        _context = None
+
+
+async def _abort_route(route) -> None:
+    await route.abort()
+
+
+async def close_browser_context() -> None:
+    """공유 브라우저 컨텍스트를 닫습니다. 프로세스 종료 시 호출합니다."""
+    global _playwright, _browser, _context, _context_lock
+
+    # 전역 상태를 먼저 비움 — 락은 만든 이벤트 루프에 묶이므로 다음 asyncio.run에서 새로 생성
+    context, browser, playwright = _context, _browser, _playwright
+    _context = _browser = _playwright = None
+    _context_lock = None
+
+    try:
+        if context is not None:
+            await context.close()
+        if browser is not None:
             await browser.close()
-    except Exception:
+    finally:
+        if playwright is not None:
+            await playwright.stop()
+
+
+async def ensure_playwright(data_dir: Path | None = None) -> None:
+    """
+    Playwright chromium이 설치되어 있는지 확인하고, 없으면 설치합니다.
+
+    설치 여부는 현재 Playwright 버전이 요구하는 실행 파일 존재로 판단하며
+    Chromium을 실행하지 않습니다.
+    data_dir이 주어지면 이후 브라우저 컨텍스트를 data_dir/_pw_profile
+    영속 프로필로 실행하도록 기록합니다.
+    """
+    global _profile_dir
+
+    if data_dir is not None:
+        _profile_dir = data_dir / _PROFILE_DIRNAME
+    if not await _chromium_installed():
         logger.info("Playwright chromium 설치 중…")
         proc = await asyncio.create_subprocess_exec(
             "playwright", "install", "chromium",
@@ -203,35 +586,55 @@ async def ensure_playwright() -> None:
         logger.info("Playwright chromium 설치 완료")
 
 
-async def _open_page(playwright_instance, *, accept_downloads: bool = False):
-    """브라우저를 열고 HIRA 페이지를 로드합니다. (browser, page) 튜플을 반환.
-    
+async def _chromium_installed() -> bool:
+    """
+    설치된 Playwright가 사용하는 chromium 실행 파일이 있는지 확인합니다.
+
+    Playwright를 업그레이드하면 이전 리비전의 chromium-* 디렉토리가 남아 있어도
+    새 버전이 찾는 실행 파일은 없으므로, 드라이버에 정확한 경로를 물어봅니다.
+    드라이버만 시작하고 브라우저는 실행하지 않습니다.
+    """
+    from playwright.async_api import async_playwright
+
+    try:
+        async with async_playwright() as pw:
+            return Path(pw.chromium.executable_path).exists()
+    except Exception as exc:
+        logger.warning(f"Playwright chromium 경로 확인 실패 — 설치 시도: {exc}")
+        return False
+
+
+async def _open_page(context):
+    """공유 컨텍스트에 새 페이지를 열고 HIRA 페이지를 로드합니다.
+
     여러 URL을 순서대로 시도하여 첫 번째로 성공하는 URL을 사용합니다.
+    반환된 페이지는 호출자가 닫아야 합니다.
     """
-    browser = await playwright_instance.chromium.launch(headless=True)
-    context = await browser.new_context(
-        user_agent=_BROWSER_UA,
-        accept_downloads=accept_downloads,
-    )
     page = await context.new_page()
-    
+
     last_error = None
     for url in TARGET_URLS:
         try:
-            resp = await page.goto(url, wait_until="networkidle", timeout=30_000)
+            resp = await page.goto(url, wait_until="domcontentloaded", timeout=30_000)
             if resp and resp.status < 400:
                 logger.info(f"HIRA 페이지 로드 성공: {url}")
-                await page.wait_for_timeout(2_000)  # JS 렌더링 마무리 대기
-                return browser, page
+                # 고정 대기 대신 파일 링크가 나타나는 즉시 진행
+                try:
+                    await page.wait_for_selector(_FILE_LINK_SELECTOR, timeout=_FILE_LINK_TIMEOUT)
+                except Exception:
+                    # iframe 안에 링크가 있는 경우 등 — 네트워크가 잠잠해질 때까지 대기
+                    logger.debug("파일 링크 대기 시간 초과 — networkidle까지 대기")
+                    await page.wait_for_load_state("networkidle", timeout=30_000)
+                return page
             else:
                 logger.warning(f"HIRA 페이지 HTTP {resp.status if resp else '?'}: {url}")
                 last_error = f"HTTP {resp.status if resp else 'no response'}"
         except Exception as exc:
             logger.warning(f"HIRA 페이지 로드 실패: {url} — {exc}")
             last_error = str(exc)
-    
+
     # 모든 URL 실패 시 마지막 에러로 예외 발생
-    await browser.close()
+    await page.close()
     raise ConnectionError(
         f"HIRA 페이지에 접속할 수 없습니다. 모든 URL 시도 실패. 마지막 오류: {last_error}"
     )
@@ -247,16 +650,111 @@ def _match_file_key(text: str) -> tuple[str | None, int]:
     Returns:
         (file_key, priority) — 매칭 실패 시 (None, 999)
     """
-    for key, keyword_sets in FILE_IDENTIFIERS.items():
-        for priority, keywords in enumerate(keyword_sets):
-            if all(kw in text for kw in keywords):
+    if not _FILE_KEYWORD_RE.search(text):
+        return None, 999
+    for key, matchers in _FILE_MATCHERS.items():
+        for priority, matcher in enumerate(matchers):
+            if matcher.match(text):
                 return key, priority
     return None, 999
 
 
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None  # 클라이언트를 만든 이벤트 루프
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    HEAD 확인용 공유 httpx 클라이언트를 반환합니다 (keep-alive 연결 재사용).
+
+    연결 풀은 만든 이벤트 루프에 묶이므로, 다른 루프(이후의 asyncio.run)에서
+    호출되면 이전 클라이언트를 버리고 새로 만듭니다.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client_loop = loop
+        _http_client = httpx.AsyncClient(
+            timeout=_HEAD_TIMEOUT,
+            follow_redirects=True,
+            headers={"User-Agent": _BROWSER_UA},
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 httpx 클라이언트를 닫습니다. 프로세스 종료 시 호출합니다."""
+    global _http_client, _http_client_loop
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _head_check(url: str, prev: dict | None = None) -> tuple[bool, dict]:
+    """
+    HTTP HEAD 조건부 요청으로 브라우저 없이 파일 변경 여부를 확인합니다.
+
+    prev에 저장된 ETag/Last-Modified를 If-None-Match/If-Modified-Since로 보냅니다.
+    304 응답이거나, 검증자와 Content-Length가 모두 prev와 일치하면 변경 없음으로 봅니다.
+
+    Returns:
+        (unchanged, validators) — validators는 {"etag", "last_modified", "size"} 중
+        응답에 있던 항목. 판단 불가(네트워크 오류, 검증자 없음) 시 (False, {})
+    """
+    if not url.startswith(("http://", "https://")):
+        return False, {}
+
+    headers: dict[str, str] = {}
+    if prev:
+        if prev.get("etag"):
+            headers["If-None-Match"] = prev["etag"]
+        if prev.get("last_modified"):
+            headers["If-Modified-Since"] = prev["last_modified"]
+
+    try:
+        resp = await _get_http_client().head(url, headers=headers)
+    except httpx.HTTPError as exc:
+        logger.info(f"HEAD 확인 실패: {url} — {exc}")
+        return False, {}
+
+    if resp.status_code == 304 and prev:
+        return True, {
+            k: prev[k] for k in ("etag", "last_modified", "size") if prev.get(k)
+        }
+    if resp.status_code >= 400:
+        return False, {}
+
+    validators: dict[str, Any] = {}
+    if resp.headers.get("etag"):
+        validators["etag"] = resp.headers["etag"]
+    if resp.headers.get("last-modified"):
+        validators["last_modified"] = resp.headers["last-modified"]
+    if not validators:
+        return False, {}
+    if resp.headers.get("content-length", "").isdigit():
+        validators["size"] = int(resp.headers["content-length"])
+
+    unchanged = (
+        prev is not None
+        and validators.get("size") == prev.get("size")
+        and all(validators.get(k) == prev.get(k) for k in ("etag", "last_modified"))
+    )
+    return unchanged, validators
+
+
 # ─────────────────────────────────────────────────────────────────────
 # 공개 API
 # ─────────────────────────────────────────────────────────────────────
+_ELEMENT_TEXTS_JS = """
+els => els.map(el => [
+  el.innerText || '',
+  el.closest('tr')?.innerText || '',
+  typeof el.href === 'string' ? el.href : '',
+])
+"""
+
+
 async def _find_clickable_elements(page) -> list[dict]:
     """
     페이지 내 모든 클릭 가능한 요소를 수집합니다.
@@ -268,28 +766,30 @@ async def _find_clickable_elements(page) -> list[dict]:
       4. iframe 내부의 위 요소들
 
     Returns:
-        [{"element": ElementHandle, "text": str, "tag": str, "source": str}, ...]
+        [{"element": ElementHandle, "text": str, "row_text": str, "href": str,
+          "tag": str, "source": str}, ...]
     """
     results = []
 
-    async def _collect(el, tag_label: str, source: str):
-        text = (await el.inner_text()).strip()
-        if text and len(text) > 1:
-            # 부모 <tr> 텍스트도 수집 — 다운로드 버튼처럼
-            # 자체 텍스트가 "다운로드"뿐인 경우 행 컨텍스트로 파일 식별
-            try:
-                row_text = await el.evaluate(
-                    "el => el.closest('tr')?.innerText || ''"
-                )
-            except Exception:
-                row_text = ""
-            results.append({
-                "element": el,
-                "text": text,
-                "row_text": row_text.strip(),
-                "tag": tag_label,
-                "source": source,
-            })
+    async def _collect(scope, selector: str, tag_label: str, source: str):
+        handles = await scope.query_selector_all(selector)
+        if not handles:
+            return
+        # 요소 텍스트와 부모 <tr> 텍스트를 한 번의 evaluate로 수집 (요소별 왕복 제거)
+        # — 다운로드 버튼처럼 자체 텍스트가 "다운로드"뿐인 경우 행 컨텍스트로 파일 식별
+        texts = await scope.evaluate(_ELEMENT_TEXTS_JS, handles)
+        for el, (text, row_text, href) in zip(handles, texts):
+            text = text.strip()
+            if text and len(text) > 1:
+                results.append({
+                    "element": el,
+                    "text": text,
+                    "row_text": row_text.strip(),
+                    # <a href>의 절대 URL (onclick 다운로드 등 href가 없으면 빈 문자열)
+                    "href": href if href.startswith(("http://", "https://")) else "",
+                    "tag": tag_label,
+                    "source": source,
+                })
 
     # 메인 페이지에서 검색
     for selector, tag_label in [
@@ -297,16 +797,14 @@ async def _find_clickable_elements(page) -> list[dict]:
         ("button", "button"),
         ("[onclick]", "onclick_el"),
     ]:
-        for el in await page.query_selector_all(selector):
-            await _collect(el, tag_label, "main")
+        await _collect(page, selector, tag_label, "main")
 
     # iframe 내부도 검색
     for frame in page.frames:
         if frame == page.main_frame:
             continue
         try:
-            for el in await frame.query_selector_all("a"):
-                await _collect(el, "a", f"iframe:{frame.name or frame.url[:50]}")
+            await _collect(frame, "a", "a", f"iframe:{frame.name or frame.url[:50]}")
         except Exception:
             pass  # iframe 접근 실패 시 무시
 
@@ -322,6 +820,7 @@ async def scrape_file_list() -> list[dict]:
           {
             "file_key": "허가초과_항암요법",
             "link_text": "허가초과 항암요법(2025.1.15.)",
+            "href": "https://www.hira.or.kr/...",   # 링크 URL (없으면 "")
             "match_priority": 0,
             "element_tag": "a",
             "source": "main"
@@ -329,14 +828,12 @@ async def scrape_file_list() -> list[dict]:
           ...
         ]
     """
-    from playwright.async_api import async_playwright
-
     results: list[dict] = []
     best_matches: dict[str, dict] = {}  # file_key → best match
 
-    async with async_playwright() as p:
-        browser, page = await _open_page(p)
-
+    context = await get_browser_context()
+    page = await _open_page(context)
+    try:
         elements = await _find_clickable_elements(page)
         logger.info(f"클릭 가능한 요소 수: {len(elements)}")
 
@@ -349,6 +846,7 @@ async def scrape_file_list() -> list[dict]:
                 match = {
                     "file_key": key,
                     "link_text": item["row_text"] or item["text"],
+                    "href": item["href"],
                     "match_priority": priority,
                     "element_tag": item["tag"],
                     "source": item["source"],
@@ -356,8 +854,8 @@ async def scrape_file_list() -> list[dict]:
                 # 같은 file_key에 대해 더 높은 우선순위(낮은 값)만 유지
                 if key not in best_matches or priority < best_matches[key]["match_priority"]:
                     best_matches[key] = match
-
-        await browser.close()
+    finally:
+        await page.close()
 
     results = list(best_matches.values())
 
@@ -395,17 +893,18 @@ async def download_file(
           "sha256": "abc123…",
           "size": 123456,
           "downloaded_at": "2025-02-03T14:30:22+09:00",
-          "source_text": "허가초과 항암요법(2025.1.15.)"
+          "source_text": "허가초과 항암요법(2025.1.15.)",
+          "download_url": "https://www.hira.or.kr/...",
+          "etag": "\"5f3a…\"",            # HEAD 빠른 경로용 (없으면 None)
+          "last_modified": "Wed, 15 Jan 2025 01:00:00 GMT"
         }
     """
-    from playwright.async_api import async_playwright
-
     data_dir.mkdir(parents=True, exist_ok=True)
     keyword_sets = FILE_IDENTIFIERS[file_key]
 
-    async with async_playwright() as p:
-        browser, page = await _open_page(p, accept_downloads=True)
-
+    context = await get_browser_context()
+    page = await _open_page(context)
+    try:
         # 해당 파일의 링크를 찾기 — 다단계 키워드 매칭
         # a 태그뿐 아니라 onclick 등 모든 클릭 가능한 요소에서 검색
         elements = await _find_clickable_elements(page)
@@ -433,7 +932,6 @@ async def download_file(
                 f"  페이지 내 텍스트 샘플 ({len(elements)}개 중 상위 30):\n"
                 + "\n".join(f"    - {t}" for t in sample_texts)
             )
-            await browser.close()
             raise FileNotFoundError(
                 f"'{file_key}' 에 해당하는 다운로드 링크를 찾을 수 없습니다. "
                 "페이지 구조가 변경되었을 수 있습니다."
@@ -455,43 +953,206 @@ async def download_file(
         versioned = f"{stem}_{ts}{ext}"
 
         dest = data_dir / versioned
-        await download.save_as(str(dest))
-        await browser.close()
+        # 브라우저가 받은 임시 파일을 옮기면서 해시 계산
+        # (Playwright 다운로드 디렉토리가 data_dir과 같은 파일시스템이면 복사 없음)
+        tmp_path = Path(await download.path())
+        file_hash, file_size = await asyncio.to_thread(_move_and_hash, tmp_path, dest)
+        download_url = download.url
+    finally:
+        await page.close()
+
+    # 다음 확인 시 HEAD 빠른 경로에 사용할 검증자 (크기가 일치할 때만 신뢰)
+    _, validators = await _head_check(download_url)
+    if validators.get("size") != file_size:
+        validators = {}
+
+    # latest 하드링크 (불가 시 복사)
+    latest = data_dir / f"{file_key}_latest{ext}"
+    _link_latest(dest, latest)
+
+    record = {
+        "filename": versioned,
+        "filepath": str(dest),
+        "latest_path": str(latest),
+        "sha256": file_hash,
+        "size": file_size,
+        "downloaded_at": now_kst(),
+        "source_text": link_text,
+        "download_url": download_url,
+        "etag": validators.get("etag"),
+        "last_modified": validators.get("last_modified"),
+    }
+
+    logger.info(
+        f"다운로드 완료: {versioned} "
+        f"({file_size:,} bytes, hash={file_hash[:16]}…)"
+    )
+    return record
 
-        # 해시 & 메타
-        file_hash = sha256_of(dest)
-        file_size = dest.stat().st_size
 
-        # latest 심볼릭 복사
+async def download_files(
+    file_keys: list[str], data_dir: Path
+) -> dict[str, dict | Exception]:
+    """
+    여러 파일을 동시에 다운로드합니다 (최대 _MAX_CONCURRENT_DOWNLOADS개).
+
+    한 파일의 실패가 다른 파일의 다운로드를 중단시키지 않습니다.
+
+    Returns:
+        {file_key: download_file 레코드 또는 발생한 Exception}
+    """
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
+
+    async def _one(file_key: str) -> dict:
+        async with sem:
+            return await download_file(file_key, data_dir)
+
+    outcomes = await asyncio.gather(
+        *(_one(key) for key in file_keys), return_exceptions=True
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+    return dict(zip(file_keys, outcomes))
+
+
+async def _check_one(
+    file_key: str,
+    current: dict | None,
+    data_dir: Path,
+    page_links: Callable[[], Awaitable[dict[str, dict]]] | None = None,
+) -> tuple[dict, dict | None, dict | None]:
+    """
+    단일 파일의 변경 여부를 확인합니다.
+
+    파일마다 별도의 임시 디렉토리를 사용하므로 여러 파일을 동시에 확인할 수 있습니다.
+    page_links는 페이지의 {file_key: scrape_file_list 항목}을 반환하는 콜백입니다.
+
+    다운로드 생략 조건:
+      - 페이지의 링크 URL이 저장된 download_url과 같고, 그 URL의 HEAD 검증자
+        (ETag/Last-Modified/크기)가 일치할 때 — 게시판은 새 게시물에 새 첨부 URL을
+        쓰므로 URL 일치를 페이지에서 먼저 확인해야 HEAD 결과를 믿을 수 있음
+      - 링크 텍스트가 게시일을 포함하고 저장된 source_text와 같을 때
+        (2026.02 기준 실제 링크 텍스트에는 날짜가 없으므로 이때는 다운로드 후 해시로 비교)
+
+    Returns:
+        (info, new_record, refreshed) — 변경이 없으면 new_record는 None,
+        refreshed는 현재 레코드에 반영할 검증자·링크 정보 (갱신할 것이 없으면 None)
+    """
+    temp_dir = data_dir / f"_temp_{file_key}"
+
+    link: dict | None = None
+    if current and page_links is not None:
+        try:
+            link = (await page_links()).get(file_key)
+        except Exception as exc:
+            logger.info(f"[{file_key}] 페이지 링크 확인 실패 — 다운로드로 확인: {exc}")
+
+    # 빠른 경로: 링크가 같은 URL을 가리키면 저장된 검증자로 HEAD 확인
+    if (
+        link is not None
+        and link.get("href")
+        and link["href"] == current.get("download_url")
+        and (current.get("etag") or current.get("last_modified"))
+    ):
+        unchanged, _ = await _head_check(current["download_url"], current)
+        if unchanged:
+            return {
+                "has_update": False,
+                "reason": "변경 없음 (링크 URL·HTTP 헤더 일치 — 다운로드 생략)",
+                "current_hash": current["sha256"],
+                "link_text": link["link_text"],
+            }, None, None
+
+    # 두 번째 빠른 경로: 게시일이 포함된 링크 텍스트가 그대로면 다운로드 생략
+    # — 날짜 없는 고정 텍스트는 파일이 바뀌어도 같으므로 판단 근거가 되지 못함
+    if (
+        link is not None
+        and _POSTING_DATE_RE.search(current.get("source_text") or "")
+        and link["link_text"] == current["source_text"]  # 같은 문자열이므로 현재 텍스트에도 게시일 포함
+    ):
+        return {
+            "has_update": False,
+            "reason": "변경 없음 (링크 텍스트 동일 — 다운로드 생략)",
+            "current_hash": current["sha256"],
+            "link_text": link["link_text"],
+        }, None, None
+
+    try:
+        temp_dir.mkdir(exist_ok=True)
+        new_record = await download_file(file_key, temp_dir)
+        new_hash = new_record["sha256"]
+
+        if current is None:
+            # 최초 다운로드
+            info: dict[str, Any] = {
+                "has_update": True,
+                "reason": "최초 다운로드 (이전 기록 없음)",
+                "current_hash": None,
+                "new_hash": new_hash,
+                "new_size": new_record["size"],
+                "link_text": new_record["source_text"],
+            }
+        elif current["size"] != new_record["size"] or current["sha256"] != new_hash:
+            # 크기부터 비교 — 크기가 다르면 해시를 볼 필요 없이 변경
+            size_changed = current["size"] != new_record["size"]
+            info = {
+                "has_update": True,
+                "reason": (
+                    "파일 내용 변경 감지 (크기 불일치)" if size_changed
+                    else "파일 내용 변경 감지 (SHA-256 불일치)"
+                ),
+                "current_hash": current["sha256"],
+                "new_hash": new_hash,
+                "current_size": current["size"],
+                "new_size": new_record["size"],
+                "link_text": new_record["source_text"],
+            }
+        else:
+            info = {
+                "has_update": False,
+                "reason": "변경 없음 (SHA-256 일치)",
+                "current_hash": current["sha256"],
+                "link_text": new_record["source_text"],
+            }
+
+        if not info["has_update"]:
+            # 파일은 같아도 검증자·URL은 저장해 두어야 다음 확인에서 HEAD 빠른 경로 사용 가능
+            refreshed = {
+                k: new_record[k]
+                for k in ("source_text", "download_url", "etag", "last_modified")
+                if new_record[k] != current.get(k)
+            }
+            return info, None, refreshed or None
+
+        # 업데이트가 있으면 실제 디렉토리로 이동 (_temp_*는 data_dir 하위 → 같은 파일시스템)
+        final = data_dir / new_record["filename"]
+        os.replace(new_record["filepath"], final)
+        new_record["filepath"] = str(final)
+
+        ext = Path(new_record["filename"]).suffix
         latest = data_dir / f"{file_key}_latest{ext}"
-        shutil.copy2(str(dest), str(latest))
-
-        record = {
-            "filename": versioned,
-            "filepath": str(dest),
-            "latest_path": str(latest),
-            "sha256": file_hash,
-            "size": file_size,
-            "downloaded_at": now_kst(),
-            "source_text": link_text,
-        }
+        _link_latest(final, latest)
+        new_record["latest_path"] = str(latest)
 
-        logger.info(
-            f"다운로드 완료: {versioned} "
-            f"({file_size:,} bytes, hash={file_hash[:16]}…)"
-        )
-        return record
+        return info, new_record, None
+
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 async def check_for_updates(data_dir: Path) -> dict:
     """
     현재 저장된 파일과 HIRA 서버의 최신 파일을 비교합니다.
 
+    모든 파일을 asyncio.gather로 동시에 확인하며, 한 파일의 실패가
+    다른 파일의 확인을 중단시키지 않습니다.
     변경이 감지된 파일은 자동으로 다운로드 후 메타데이터를 갱신합니다.
 
     Returns:
         {
           "checked_at": "2025-02-03T14:30:00+09:00",
+          "any_update": True,   # has_update가 True인 파일이 하나라도 있으면 True
           "files": {
             "허가초과_항암요법": {
               "has_update": True,
@@ -502,90 +1163,81 @@ async def check_for_updates(data_dir: Path) -> dict:
           }
         }
     """
-    store = MetadataStore(data_dir)
+    store = MetadataStore.for_dir(data_dir)
     file_results: dict[str, Any] = {}
 
-    for file_key in FILE_IDENTIFIERS:
-        current = store.get_current(file_key)
-        temp_dir = data_dir / "_temp"
+    # 파일 목록 스캔은 한 번만 수행하여 파일 간 공유 (기존 기록이 있는 파일만 사용)
+    listing: asyncio.Future | None = None
 
-        try:
-            temp_dir.mkdir(exist_ok=True)
-            new_record = await download_file(file_key, temp_dir)
-            new_hash = new_record["sha256"]
-
-            if current is None:
-                # 최초 다운로드
-                info: dict[str, Any] = {
-                    "has_update": True,
-                    "reason": "최초 다운로드 (이전 기록 없음)",
-                    "current_hash": None,
-                    "new_hash": new_hash,
-                    "new_size": new_record["size"],
-                    "link_text": new_record["source_text"],
-                }
-            elif current["sha256"] != new_hash:
-                info = {
-                    "has_update": True,
-                    "reason": "파일 내용 변경 감지 (SHA-256 불일치)",
-                    "current_hash": current["sha256"],
-                    "new_hash": new_hash,
-                    "current_size": current["size"],
-                    "new_size": new_record["size"],
-                    "link_text": new_record["source_text"],
-                }
-            else:
-                info = {
-                    "has_update": False,
-                    "reason": "변경 없음 (SHA-256 일치)",
-                    "current_hash": current["sha256"],
-                    "link_text": new_record["source_text"],
-                }
-
-            # 업데이트가 있으면 실제 디렉토리로 이동
-            if info["has_update"]:
-                final = data_dir / new_record["filename"]
-                shutil.move(new_record["filepath"], str(final))
-                new_record["filepath"] = str(final)
-
-                ext = Path(new_record["filename"]).suffix
-                latest = data_dir / f"{file_key}_latest{ext}"
-                shutil.copy2(str(final), str(latest))
-                new_record["latest_path"] = str(latest)
-
-                store.update(file_key, new_record)
+    async def _page_links() -> dict[str, dict]:
+        nonlocal listing
+        if listing is None:
+            listing = asyncio.ensure_future(scrape_file_list())
+        return {m["file_key"]: m for m in await asyncio.shield(listing)}
 
-            file_results[file_key] = info
+    keys = list(FILE_IDENTIFIERS)
+    outcomes = await asyncio.gather(
+        *(_check_one(key, store.get_current(key), data_dir, _page_links) for key in keys),
+        return_exceptions=True,
+    )
 
-        except Exception as exc:
-            logger.error(f"[{file_key}] 업데이트 확인 실패: {exc}")
+    # 메타데이터 갱신은 gather 이후 한 번에 수행 (metadata.json 동시 쓰기 방지)
+    new_records: dict[str, dict] = {}
+    refreshed: dict[str, dict] = {}
+    for file_key, outcome in zip(keys, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"[{file_key}] 업데이트 확인 실패: {outcome}")
             file_results[file_key] = {
                 "has_update": None,
-                "reason": f"오류 발생: {exc}",
+                "reason": f"오류 발생: {outcome}",
                 "error": True,
             }
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-
-    # 업데이트 후 구파일 정리
-    cleanup_old_files(data_dir, keep_latest_only=True)
-
-    return {"checked_at": now_kst(), "files": file_results}
+            continue
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+        info, new_record, fields = outcome
+        if new_record is not None:
+            new_records[file_key] = new_record
+        if fields is not None:
+            refreshed[file_key] = fields
+        file_results[file_key] = info
+
+    store.update_many(new_records)
+    store.refresh_many(refreshed)
+
+    # 업데이트가 있었으면 구파일 정리 (이미 읽은 메타데이터 재사용, 파일 삭제는 스레드에서)
+    if new_records:
+        await asyncio.to_thread(cleanup_old_files, data_dir, keep_latest_only=True, store=store)
+
+    return {
+        "checked_at": now_kst(),
+        "any_update": bool(new_records),
+        "files": file_results,
+    }
 
 
-def cleanup_old_files(data_dir: Path, *, keep_latest_only: bool = True) -> dict:
+def cleanup_old_files(
+    data_dir: Path,
+    *,
+    keep_latest_only: bool = True,
+    store: MetadataStore | None = None,
+) -> dict:
     """
     데이터 디렉토리에서 구 버전 파일을 정리합니다.
 
     정책:
-      - *_latest.* 파일은 항상 보존 (현재 파일의 심볼릭 복사)
+      - *_latest.* 파일은 항상 보존 (현재 파일의 하드링크 또는 복사본)
       - keep_latest_only=True: latest가 아닌 버전 파일을 모두 삭제
-      - metadata.json, scheduler_config.json은 항상 보존
+      - metadata.json, scheduler_config.json, .page_text_cache.json은 항상 보존
+
+    Args:
+        store: 이미 로드한 MetadataStore (없으면 metadata.json을 새로 읽음)
 
     Returns:
         {"deleted": [...], "kept": [...], "errors": [...]}
     """
-    protected_names = {"metadata.json", "scheduler_config.json", ".env"}
+    protected_names = {"metadata.json", "scheduler_config.json", ".page_text_cache.json", ".env"}
     deleted = []
     kept = []
     errors = []
@@ -593,7 +1245,8 @@ def cleanup_old_files(data_dir: Path, *, keep_latest_only: bool = True) -> dict:
     if not data_dir.exists():
         return {"deleted": [], "kept": [], "errors": ["디렉토리 없음"]}
 
-    store = MetadataStore(data_dir)
+    if store is None:
+        store = MetadataStore.for_dir(data_dir)
 
     # 현재 파일의 실제 경로 목록
     current_filenames: set[str] = set()
@@ -602,27 +1255,27 @@ def cleanup_old_files(data_dir: Path, *, keep_latest_only: bool = True) -> dict:
         if cur:
             current_filenames.add(cur["filename"])
 
-    for item in data_dir.iterdir():
-        if item.name in protected_names:
-            kept.append(item.name)
-            continue
-        if "_latest" in item.name:
-            kept.append(item.name)
-            continue
-        if item.is_dir():
-            continue
-        if item.name in current_filenames:
-            kept.append(item.name)
-            continue
-
-        # 구 버전 → 삭제
-        if keep_latest_only:
-            try:
-                item.unlink()
-                deleted.append(item.name)
-                logger.info(f"구 파일 삭제: {item.name}")
-            except Exception as exc:
-                errors.append(f"{item.name}: {exc}")
+    # scandir: 디렉토리 항목의 이름/종류를 한 번에 읽어 항목별 stat 호출을 피함
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name in protected_names or "_latest" in name:
+                kept.append(name)
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            if name in current_filenames:
+                kept.append(name)
+                continue
+
+            # 구 버전 → 삭제
+            if keep_latest_only:
+                try:
+                    os.unlink(entry.path)
+                    deleted.append(name)
+                    logger.info(f"구 파일 삭제: {name}")
+                except Exception as exc:
+                    errors.append(f"{name}: {exc}")
 
     if deleted:
         logger.info(f"구 파일 정리 완료: {len(deleted)}개 삭제")
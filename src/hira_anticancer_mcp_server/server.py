@@ -37,7 +37,9 @@ from .scraper import (
     MetadataStore,
     check_for_updates,
     cleanup_old_files,
-    download_file,
+    close_browser_context,
+    close_http_client,
+    download_files,
     ensure_playwright,
     scrape_file_list,
 )
@@ -65,6 +67,7 @@ logger = logging.getLogger("hira-mcp-server")
 # ─────────────────────────────────────────────────────────────────────
 server = Server("hira-anticancer-mcp-server")
 _scheduler: HiraScheduler | None = None
+_playwright_task: asyncio.Task | None = None  # 기동 시 백그라운드로 시작한 ensure_playwright
 
 
 def _get_scheduler() -> HiraScheduler:
@@ -75,6 +78,13 @@ def _get_scheduler() -> HiraScheduler:
     return _scheduler
 
 
+async def _wait_playwright() -> None:
+    """Playwright가 필요한 tool 실행 전에 기동 시 시작한 설치 확인이 끝나기를 기다립니다."""
+    if _playwright_task is not None:
+        # 한 tool 호출이 취소되어도 공유 설치 작업은 계속 진행
+        await asyncio.shield(_playwright_task)
+
+
 # ─────────────────────────────────────────────────────────────────────
 # Tool 목록 등록
 # ─────────────────────────────────────────────────────────────────────
@@ -356,6 +366,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageConte
 async def _handle_check_updates(args: dict) -> list[TextContent]:
     """hira_check_updates 실행"""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    await _wait_playwright()
     results = await check_for_updates(DATA_DIR)
 
     # 사람이 읽기 좋은 요약 생성
@@ -383,35 +394,43 @@ async def _handle_check_updates(args: dict) -> list[TextContent]:
 async def _handle_download_files(args: dict) -> list[TextContent]:
     """hira_download_files 실행"""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    store = MetadataStore(DATA_DIR)
+    store = MetadataStore.for_dir(DATA_DIR)
 
     file_key = args.get("file_key")
     keys = [file_key] if file_key else list(FILE_IDENTIFIERS.keys())
 
-    results = []
-    for key in keys:
-        if key not in FILE_IDENTIFIERS:
-            results.append(f"⚠️ 알 수 없는 파일 키: {key}")
-            continue
+    results = [
+        f"⚠️ 알 수 없는 파일 키: {key}" for key in keys if key not in FILE_IDENTIFIERS
+    ]
+    await _wait_playwright()
+    outcomes = await download_files(
+        [key for key in keys if key in FILE_IDENTIFIERS], DATA_DIR
+    )
+    records = {k: r for k, r in outcomes.items() if not isinstance(r, Exception)}
+    store.update_many(records)
 
-        record = await download_file(key, DATA_DIR)
-        store.update(key, record)
+    for key, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            logger.error(f"[{key}] 다운로드 실패: {outcome}")
+            results.append(f"❌ {key} 다운로드 실패: {outcome}")
+            continue
         results.append(
             f"✅ {key} 다운로드 완료\n"
-            f"   파일: {record['filename']}\n"
-            f"   크기: {record['size']:,} bytes\n"
-            f"   SHA-256: {record['sha256'][:16]}…"
+            f"   파일: {outcome['filename']}\n"
+            f"   크기: {outcome['size']:,} bytes\n"
+            f"   SHA-256: {outcome['sha256'][:16]}…"
         )
 
-    # 구파일 정리
-    cleanup_old_files(DATA_DIR, keep_latest_only=True)
+    # 구파일 정리 — 새로 받은 파일이 있을 때만 (파일 삭제가 이벤트 루프를 막지 않도록 스레드에서)
+    if records:
+        await asyncio.to_thread(cleanup_old_files, DATA_DIR, keep_latest_only=True, store=store)
 
     return _to_text("\n\n".join(results))
 
 
 async def _handle_get_status(args: dict) -> list[TextContent]:
     """hira_get_status 실행"""
-    store = MetadataStore(DATA_DIR)
+    store = MetadataStore.for_dir(DATA_DIR)
     status = store.get_all_status()
     scheduler = _get_scheduler()
     sched_status = scheduler.get_status()
@@ -448,6 +467,7 @@ async def _handle_get_status(args: dict) -> list[TextContent]:
 
 async def _handle_list_files(args: dict) -> list[TextContent]:
     """hira_list_files 실행"""
+    await _wait_playwright()
     files = await scrape_file_list()
 
     if not files:
@@ -474,7 +494,7 @@ async def _handle_list_history(args: dict) -> list[TextContent]:
             f"가능한 값: {', '.join(FILE_IDENTIFIERS.keys())}"
         )
 
-    store = MetadataStore(DATA_DIR)
+    store = MetadataStore.for_dir(DATA_DIR)
     current = store.get_current(file_key)
     history = store.get_history(file_key)[:limit]
 
@@ -501,7 +521,7 @@ async def _handle_list_history(args: dict) -> list[TextContent]:
 
 async def _handle_cleanup(args: dict) -> list[TextContent]:
     """hira_cleanup 실행"""
-    result = cleanup_old_files(DATA_DIR, keep_latest_only=True)
+    result = await asyncio.to_thread(cleanup_old_files, DATA_DIR, keep_latest_only=True)
 
     lines = ["🧹 구 파일 정리 결과", "─" * 40]
     if result["deleted"]:
@@ -555,6 +575,7 @@ async def _handle_scheduler(args: dict) -> list[TextContent]:
                         "※ 스케줄 루프는 유지되나 실행을 건너뜁니다.")
 
     elif action == "run_now":
+        await _wait_playwright()
         result = await scheduler.run_now()
         if "error" in result:
             return _to_text(f"⚠️ 즉시 실행 오류: {result['error']}")
@@ -590,13 +611,17 @@ async def _handle_scheduler(args: dict) -> list[TextContent]:
 
 # ── 파일 리더 핸들러 ────────────────────────────────────────────
 
+# _latest 파일로 인정하는 확장자 (우선순위 순)
+_LATEST_EXTS = (".xlsx", ".xls", ".pdf", ".hwp")
+
+
 def _resolve_latest_file(file_key: str) -> Path | None:
     """file_key에 대응하는 최신 파일 경로를 찾습니다."""
     if file_key not in FILE_IDENTIFIERS:
         return None
 
     # MetadataStore에서 latest_path 확인
-    store = MetadataStore(DATA_DIR)
+    store = MetadataStore.for_dir(DATA_DIR)
     current = store.get_current(file_key)
     if current:
         # latest_path 우선
@@ -608,11 +633,11 @@ def _resolve_latest_file(file_key: str) -> Path | None:
         if filepath and Path(filepath).exists():
             return Path(filepath)
 
-    # glob fallback: DATA_DIR에서 *_latest.* 패턴
-    for ext in [".xlsx", ".xls", ".pdf", ".hwp"]:
-        candidate = DATA_DIR / f"{file_key}_latest{ext}"
-        if candidate.exists():
-            return candidate
+    # glob fallback: DATA_DIR에서 *_latest.* 패턴 (디렉토리 한 번 조회, 확장자 우선순위 유지)
+    candidates = {p.suffix: p for p in DATA_DIR.glob(f"{file_key}_latest.*")}
+    for ext in _LATEST_EXTS:
+        if ext in candidates:
+            return candidates[ext]
 
     return None
 
@@ -638,7 +663,7 @@ async def _handle_read_excel(args: dict) -> list[TextContent | ImageContent]:
         )
 
     logger.info(f"Excel 읽기: {filepath}")
-    return read_excel(
+    return await read_excel(
         filepath,
         sheet=args.get("sheet"),
         cancer_type=args.get("cancer_type"),
@@ -667,16 +692,41 @@ async def _handle_read_pdf(args: dict) -> list[TextContent | ImageContent]:
         )
 
     logger.info(f"PDF 읽기: {filepath}")
-    return read_pdf(
+    return await read_pdf(
         filepath,
         pages=args.get("pages"),
         section=args.get("section"),
         cancer_type=args.get("cancer_type"),
         search=args.get("search"),
         text_only=args.get("text_only", False),
+        on_progress=_progress_reporter(),
     )
 
 
+def _progress_reporter():
+    """
+    클라이언트가 progressToken을 보낸 경우 진행 상황 알림 콜백을 반환합니다.
+
+    MCP tool 결과는 한 번에 반환되므로, 이미지 렌더링이 긴 요청에서
+    클라이언트가 진행 여부를 알 수 있도록 notifications/progress를 보냅니다.
+    """
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
+
+    async def _report(done: int, total: int) -> None:
+        try:
+            await ctx.session.send_progress_notification(token, done, total)
+        except Exception as exc:
+            logger.debug(f"진행 알림 전송 실패 (무시): {exc}")
+
+    return _report
+
+
 # ─────────────────────────────────────────────────────────────────────
 # 서버 진입점
 # ─────────────────────────────────────────────────────────────────────
@@ -686,8 +736,12 @@ def main() -> None:
     logger.info(f"데이터 디렉토리: {DATA_DIR}")
 
     async def _run():
-        # Playwright 사전 확인
-        await ensure_playwright()
+        global _playwright_task
+
+        # Playwright 설치 확인은 백그라운드로 — stdio 연결을 기다리게 하지 않음
+        # (브라우저는 첫 스크래핑 때 실행되어 서버 수명 동안 재사용)
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        _playwright_task = asyncio.create_task(ensure_playwright(DATA_DIR))
 
         # 스케줄러 자동 시작
         scheduler = _get_scheduler()
@@ -696,12 +750,16 @@ def main() -> None:
             logger.info("스케줄러 자동 시작 완료")
 
         # MCP stdio 서버 실행
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(
-                read_stream,
-                write_stream,
-                server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options(),
+                )
+        finally:
+            await close_browser_context()
+            await close_http_client()
 
     asyncio.run(_run())
 